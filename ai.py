@@ -1,81 +1,336 @@
 import random
+import time
+from functools import lru_cache
+from board import Board, has_win, iter_bits, popcount, FULL_MASK
+import book
+import tracing
+from symmetry import LRUCache, canonicalize, canonical_key, from_canonical
+
+# Center first, then corners, then edges
+MOVE_ORDER = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+
+# Transposition table flags
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Depth-limited search: a win outscores any heuristic value
+WIN_SCORE = 10 ** 9
+DEFAULT_TIME_BUDGET = 1.0
+TIME_CHECK_INTERVAL = 256  # nodes between clock reads
+
+class SearchTimeout(Exception):
+    pass
+
+def as_board(board):
+    return board if isinstance(board, Board) else Board.from_list(board)
+
+@lru_cache(maxsize=None)
+def center_order(size):
+    # Squares sorted by distance from the center, for boards larger than 3x3
+    mid = (size - 1) / 2
+    def distance(i):
+        row, col = divmod(i, size)
+        return ((row - mid) ** 2 + (col - mid) ** 2, i)
+    return sorted(range(size * size), key=distance)
 
 class TicTacToeAI:
-    def __init__(self, ai_player="O", difficulty="easy"):
+    # Shared by every instance so positions solved in one game are reused in the next.
+    # Keyed on the canonical (mask of side to move, mask of opponent), so X and O
+    # and all rotations/reflections of a position share one entry.
+    transposition_table = {}
+    # Chosen moves per canonical position and strategy, in canonical orientation
+    position_cache = LRUCache(maxsize=4096)
+
+    def __init__(self, ai_player="O", difficulty="easy", time_budget=None, rng=None, iterations=None, workers=1):
         self.ai_player = ai_player
         self.human_player = "X" if ai_player == "O" else "O"
-        self.difficulty = difficulty  # 'easy', 'medium', 'hard'
+        self.difficulty = difficulty  # 'easy', 'medium', 'hard', 'mcts'
+        self.time_budget = time_budget  # seconds per move for the iterative-deepening search
+        self.rng = rng  # a random.Random gives reproducible play; None uses the global one
+        self.nodes_visited = 0
+        self.tt_hits = 0
+        self.depth_reached = 0
+        self.deadline = None
+        self.stop_event = None  # set by ai_worker to abandon a search early
+        self.iterations = iterations  # MCTS playouts per move; None means the time budget or the default
+        self.workers = workers  # processes searching in parallel for MCTS
+        self.mcts = None  # kept between moves so the search tree can be reused
 
     def get_move(self, board):
+        board = as_board(board)
+        if tracing.ENABLED:
+            nodes = self.nodes_visited
+            with tracing.region("ai.get_move", difficulty=self.difficulty):
+                move = self.choose_move(board)
+            tracing.counter("ai.nodes_per_move", self.nodes_visited - nodes)
+            return move
+        return self.choose_move(board)
+
+    def choose_move(self, board):
         if self.difficulty == "easy":
             return self.random_move(board)
         elif self.difficulty == "medium":
             return self.medium_move(board)
         elif self.difficulty == "hard":
             return self.minimax_move(board)
+        elif self.difficulty == "mcts":
+            return self.mcts_move(board)
         else:
             return self.random_move(board)
 
     def random_move(self, board):
-        available_moves = [i for i, cell in enumerate(board) if cell == ""]
-        return random.choice(available_moves) if available_moves else None
+        available_moves = as_board(board).empty_squares()
+        rng = self.rng or random
+        return rng.choice(available_moves) if available_moves else None
 
     def medium_move(self, board):
-        # Block human winning move if possible
-        for move in self.available_moves(board):
-            board_copy = board[:]
-            board_copy[move] = self.human_player
-            if self.check_winner(board_copy, self.human_player):
-                return move
+        board = as_board(board)
+        if not board.is_classic():
+            block = self.find_winning_move(board, self.human_player)
+            return block if block is not None else self.random_move(board)
+        (own, opp), sym = canonicalize(board.mask(self.ai_player), board.mask(self.human_player))
+        key = ("medium", own, opp)
+        blocks = self.position_cache.get(key)
+        if blocks is None:
+            # Every square that stops the human winning next turn; human stones go in the X mask
+            canonical = Board(opp, own)
+            blocks = tuple(move for move in canonical.empty_squares() if canonical.would_win(move, "X"))
+            self.position_cache.put(key, blocks)
+        if blocks:
+            # Lowest square on the real board, so the choice does not depend on the orientation
+            return min(from_canonical(move, sym) for move in blocks)
         return self.random_move(board)
 
     def minimax_move(self, board):
+        board = as_board(board)
+        if not board.is_classic():
+            return self.iterative_deepening_move(board)
+        (own, opp), sym = canonicalize(board.mask(self.ai_player), board.mask(self.human_player))
+        key = ("hard", own, opp)
+        move = self.position_cache.get(key, -1)
+        if move == -1:
+            entry = book.lookup(own, opp)
+            move = entry[0] if entry is not None else self.search_root(own, opp)[0]
+            self.position_cache.put(key, move)
+        return from_canonical(move, sym)
+
+    def mcts_move(self, board):
+        if self.mcts is None:
+            from mcts import MCTS
+            self.mcts = MCTS(self.iterations, workers=self.workers, rng=self.rng)
+        self.mcts.time_budget = self.time_budget
+        move = self.mcts.best_move(board, self.ai_player, self.stop_event)
+        self.nodes_visited += self.mcts.iterations_run
+        return move
+
+    def tactical_move(self, board):
+        # Win now, else block, else play near the center
+        move = self.find_winning_move(board, self.ai_player)
+        if move is None:
+            move = self.find_winning_move(board, self.human_player)
+        if move is None:
+            moves = self.available_moves(board)
+            move = moves[0] if moves else None
+        return move
+
+    def find_winning_move(self, board, player):
+        for move in board.empty_squares():
+            if board.would_win(move, player):
+                return move
+        return None
+
+    def iterative_deepening_move(self, board, time_budget=None):
+        # Searches one ply deeper each round and keeps the best move of the last
+        # finished round, so a move is always ready when the budget runs out
+        board = as_board(board)
+        if time_budget is None:
+            time_budget = self.time_budget if self.time_budget is not None else DEFAULT_TIME_BUDGET
+        rules = board.rules
+        own = board.mask(self.ai_player)
+        opp = board.mask(self.human_player)
+        best_move = self.tactical_move(board)
+        self.depth_reached = 0
+        self.deadline = time.perf_counter() + time_budget
+        table = {}
+        max_depth = popcount(board.empty_mask())
+        try:
+            for depth in range(1, max_depth + 1):
+                move, score = self.search_limited_root(rules, own, opp, depth, table, best_move)
+                if move is not None:
+                    best_move = move
+                self.depth_reached = depth
+                if abs(score) >= WIN_SCORE:
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+        return best_move
+
+    def search_limited_root(self, rules, own, opp, depth, table, first_move):
+        moves = self.candidate_moves(rules, own, opp)
+        if first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
         best_score = -float('inf')
         best_move = None
-        for move in self.available_moves(board):
-            board[move] = self.ai_player
-            score = self.minimax(board, False)
-            board[move] = ""
+        alpha, beta = -float('inf'), float('inf')
+        for move in moves:
+            score = -self.negamax_limited(rules, opp, own | 1 << move, move, depth - 1, -beta, -alpha, table)
             if score > best_score:
                 best_score = score
                 best_move = move
-        return best_move
+            alpha = max(alpha, score)
+        return best_move, best_score
 
-    def minimax(self, board, is_maximizing):
-        if self.check_winner(board, self.ai_player):
-            return 1
-        elif self.check_winner(board, self.human_player):
-            return -1
-        elif "" not in board:
+    def negamax_limited(self, rules, own, opp, last_move, depth, alpha, beta, table):
+        self.nodes_visited += 1
+        if self.deadline is not None and self.nodes_visited % TIME_CHECK_INTERVAL == 0:
+            if time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+            if self.stop_event is not None and self.stop_event.is_set():
+                raise SearchTimeout()
+        if rules.wins_through(opp, last_move):
+            # Prefer wins found at shallower plies (more depth left)
+            return -(WIN_SCORE + depth)
+        if own | opp == rules.full_mask:
             return 0
+        if depth == 0:
+            return self.evaluate(rules, own, opp)
+
+        key = (own, opp)
+        entry = table.get(key)
+        best_first = None
+        if entry is not None:
+            entry_depth, score, flag, best_first = entry
+            if entry_depth >= depth:
+                self.tt_hits += 1
+                if flag == EXACT:
+                    return score
+                elif flag == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        moves = self.candidate_moves(rules, own, opp)
+        if best_first in moves:
+            moves.remove(best_first)
+            moves.insert(0, best_first)
 
-        if is_maximizing:
-            best_score = -float('inf')
-            for move in self.available_moves(board):
-                board[move] = self.ai_player
-                score = self.minimax(board, False)
-                board[move] = ""
-                best_score = max(score, best_score)
-            return best_score
+        alpha_orig = alpha
+        best_score = -float('inf')
+        best_move = None
+        for move in moves:
+            score = -self.negamax_limited(rules, opp, own | 1 << move, move, depth - 1, -beta, -alpha, table)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        table[key] = (depth, best_score, flag, best_move)
+        return best_score
+
+    def candidate_moves(self, rules, own, opp):
+        # Empty squares next to a stone, nearest the center first
+        taken = own | opp
+        empty = rules.full_mask & ~taken
+        if not taken:
+            return [center_order(rules.size)[0]]
+        near = 0
+        for i in iter_bits(taken):
+            near |= rules.neighbors[i]
+        near &= empty
+        return [i for i in center_order(rules.size) if near >> i & 1]
+
+    def evaluate(self, rules, own, opp):
+        # Sum over lines still open to one side only, weighted by stones already in them
+        score = 0
+        for win in rules.line_masks:
+            mine = own & win
+            theirs = opp & win
+            if mine and not theirs:
+                score += 10 ** popcount(mine)
+            elif theirs and not mine:
+                score -= 10 ** popcount(theirs)
+        return score
+
+    def search_root(self, own, opp):
+        best_score = -float('inf')
+        best_move = None
+        alpha, beta = -float('inf'), float('inf')
+        empty = FULL_MASK & ~(own | opp)
+        for move in MOVE_ORDER:
+            if not empty >> move & 1:
+                continue
+            score = -self.negamax(opp, own | 1 << move, -beta, -alpha)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+        return best_move, best_score
+
+    def negamax(self, own, opp, alpha, beta):
+        # Scores are from the point of view of the side to move (`own`).
+        # Quicker wins (more empty squares left) score higher.
+        self.nodes_visited += 1
+        empty = FULL_MASK & ~(own | opp)
+        if has_win(opp):
+            return -(1 + popcount(empty))
+        if not empty:
+            return 0
+
+        key = canonical_key(own, opp)
+        entry = self.transposition_table.get(key)
+        if entry is not None:
+            self.tt_hits += 1
+            score, flag = entry
+            if flag == EXACT:
+                return score
+            elif flag == LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+
+        alpha_orig = alpha
+        best_score = -float('inf')
+        for move in MOVE_ORDER:
+            if not empty >> move & 1:
+                continue
+            score = -self.negamax(opp, own | 1 << move, -beta, -alpha)
+            best_score = max(score, best_score)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
         else:
-            best_score = float('inf')
-            for move in self.available_moves(board):
-                board[move] = self.human_player
-                score = self.minimax(board, True)
-                board[move] = ""
-                best_score = min(score, best_score)
-            return best_score
+            flag = EXACT
+        self.transposition_table[key] = (best_score, flag)
+        return best_score
+
+    def reset_stats(self):
+        self.nodes_visited = 0
+        self.tt_hits = 0
 
     def available_moves(self, board):
-        return [i for i, cell in enumerate(board) if cell == ""]
+        board = as_board(board)
+        empty = board.empty_mask()
+        order = MOVE_ORDER if board.is_classic() else center_order(board.size)
+        return [i for i in order if empty >> i & 1]
 
     def check_winner(self, board, player):
-        wins = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # columns
-            [0, 4, 8], [2, 4, 6]              # diagonals
-        ]
-        for line in wins:
-            if all(board[i] == player for i in line):
-                return True
-        return False
+        return as_board(board).is_winner(player)
@@ -0,0 +1,90 @@
+# Runs AI searches off the Tk event loop and hands the move back through root.after.
+import threading
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+
+POLL_INTERVAL = 15  # ms between checks for a finished search
+
+def compute_move(ai, board, stop_event=None):
+    # Module level so a process pool can pickle it
+    ai.stop_event = stop_event
+    try:
+        return ai.get_move(board)
+    finally:
+        ai.stop_event = None
+
+class AIWorker:
+    def __init__(self, root, kind="thread"):
+        self.root = root
+        self.kind = kind  # 'thread' or 'process'
+        self.executor = None
+        self.future = None
+        self.stop_event = None
+        self.callback = None
+        self.poll_id = None
+
+    def get_executor(self):
+        if self.executor is None:
+            if self.kind == "process":
+                # multiprocessing is slow to import, so only pay for it when asked. Spawn rather
+                # than fork: by now this process runs Tk plus the audio, saver and leaderboard threads
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                self.executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai")
+        return self.executor
+
+    def is_busy(self):
+        return self.future is not None
+
+    def submit(self, ai, board, callback):
+        self.cancel()
+        self.callback = callback
+        if self.kind == "process":
+            # Events can't cross a process boundary; a cancelled result is just dropped
+            self.future = self.get_executor().submit(compute_move, ai, board.copy())
+        else:
+            self.stop_event = threading.Event()
+            self.future = self.get_executor().submit(compute_move, ai, board.copy(), self.stop_event)
+        self.poll_id = self.root.after(POLL_INTERVAL, self.poll)
+
+    def poll(self):
+        self.poll_id = None
+        future = self.future
+        if future is None:
+            return
+        if not future.done():
+            self.poll_id = self.root.after(POLL_INTERVAL, self.poll)
+            return
+        callback = self.callback
+        self.future = None
+        self.stop_event = None
+        self.callback = None
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if isinstance(error, BrokenExecutor):
+                # A crashed worker process takes its pool with it; start a fresh one next move
+                self.executor = None
+            # Raised from a Tk callback, so it is reported through report_callback_exception
+            raise error
+        callback(future.result())
+
+    def cancel(self):
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+        if self.stop_event is not None:
+            self.stop_event.set()
+            self.stop_event = None
+        self.callback = None
+
+    def shutdown(self):
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
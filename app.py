@@ -0,0 +1,172 @@
+# Single-process application shell: one tk.Tk root, one frame per screen.
+import sys
+import tkinter as tk
+from theme_utils import center_window, load_pixel_font, styled_button
+from settings import store as settings_store
+from savegame import clear_save, has_save, load_save
+
+WINDOW_SIZE = (600, 600)
+
+class MainMenu:
+    def __init__(self, root, app):
+        self.root = root
+        self.app = app
+        root.configure(bg="#1e1e1e")
+        pixel_font = load_pixel_font()
+
+        tk.Label(root, text="Tic-Tac-Toe", font=pixel_font, bg="#1e1e1e", fg="#00f0ff").pack(pady=20)
+        self.resume_button = styled_button(root, "Resume Game", app.resume_game)
+        self.play_button = styled_button(root, "Play", lambda: app.show("setup"))
+        self.play_button.pack(pady=10)
+        styled_button(root, "Leaderboard", lambda: app.show("leaderboard")).pack(pady=10)
+        styled_button(root, "Options", lambda: app.show("options")).pack(pady=10)
+        styled_button(root, "Quit", app.quit).pack(pady=10)
+
+    def on_show(self):
+        # The save can appear or vanish while the menu is cached
+        if has_save():
+            self.resume_button.pack(pady=10, before=self.play_button)
+        else:
+            self.resume_button.pack_forget()
+
+def build_menu(frame, app):
+    return MainMenu(frame, app)
+
+def build_setup(frame, app):
+    from setup_window import SetupWindow
+    return SetupWindow(frame, app)
+
+def build_options(frame, app):
+    from options_window import OptionsWindow
+    return OptionsWindow(frame, app)
+
+def build_leaderboard(frame, app):
+    from leaderboard_window import LeaderboardWindow
+    return LeaderboardWindow(frame, app)
+
+# Screen name -> (window title, builder). Builders import their module on first use.
+SCREENS = {
+    "menu": ("Tic-Tac-Toe Main Menu", build_menu),
+    "setup": ("Game Setup", build_setup),
+    "options": ("Game Options", build_options),
+    "leaderboard": ("Leaderboard", build_leaderboard),
+}
+
+class App:
+    def __init__(self, root):
+        self.root = root
+        root.configure(bg="#1e1e1e")
+        self.frames = {}
+        self.screens = {}
+        self.stale = set()  # screens drawn with an old theme, rebuilt once they are hidden
+        self.current = None
+        self.game = None
+        self.game_frame = None
+        settings_store.subscribe(self.on_settings_changed)
+        settings_store.watch(root)
+
+    def on_settings_changed(self, settings, changed):
+        # Hidden screens are rebuilt with the new theme next time they are shown; the
+        # visible one is marked stale and dropped as soon as it is hidden. A running game
+        # is not cached and picks changes up itself
+        if "theme" in changed:
+            for name in list(self.frames):
+                if self.frames[name] is self.current:
+                    self.stale.add(name)
+                else:
+                    self.drop(name)
+
+    def drop(self, name):
+        self.stale.discard(name)
+        self.screens.pop(name, None)
+        frame = self.frames.pop(name, None)
+        if frame is not None:
+            if frame is self.current:
+                self.current = None
+            frame.destroy()
+
+    def hide_current(self):
+        if self.current is not None:
+            self.current.pack_forget()
+            for name in list(self.stale):
+                if self.frames.get(name) is self.current:
+                    self.drop(name)
+            self.current = None
+
+    def raise_frame(self, frame):
+        self.hide_current()
+        frame.pack(fill="both", expand=True)
+        self.current = frame
+
+    def show(self, name):
+        self.end_game()
+        title, build = SCREENS[name]
+        self.root.title(title)
+        center_window(self.root, *WINDOW_SIZE)
+        frame = self.frames.get(name)
+        if frame is None:
+            # Built on first visit, then kept for the life of the process
+            frame = tk.Frame(self.root, bg="#1e1e1e")
+            self.frames[name] = frame
+            self.screens[name] = build(frame, self)
+            # Screens set their own title when built; keep the shell's
+            self.root.title(title)
+        self.raise_frame(frame)
+        screen = self.screens[name]
+        if hasattr(screen, "on_show"):
+            screen.on_show()
+
+    def reload(self, name):
+        # Throw away a cached screen, e.g. after its settings file changed underneath it
+        self.drop(name)
+        self.show(name)
+
+    def start_game(self, mode, difficulty, player1_name, player2_name, player_symbol, resume_state=None):
+        from game import TicTacToe
+        self.end_game()
+        self.game_frame = tk.Frame(self.root, bg="#1e1e1e")
+        self.raise_frame(self.game_frame)
+        self.game = TicTacToe(self.game_frame, mode, difficulty, player1_name, player2_name, player_symbol,
+                              app=self, resume_state=resume_state)
+
+    def resume_game(self):
+        state = load_save()
+        if state is None:
+            self.show("menu")
+            return
+        try:
+            self.start_game(state["mode"], state["difficulty"], state["player1_name"], state["player2_name"],
+                            state["player_symbol"], resume_state=state)
+        except (KeyError, TypeError, ValueError):
+            # A save from an incompatible version: drop it rather than fail on every launch
+            clear_save()
+            self.show("menu")
+
+    def end_game(self):
+        # A game screen depends on its players and settings, so it is rebuilt for each match
+        if self.game is not None:
+            self.game.shutdown()
+            self.game = None
+        if self.game_frame is not None:
+            if self.game_frame is self.current:
+                self.current = None
+            self.game_frame.destroy()
+            self.game_frame = None
+
+    def quit(self):
+        self.end_game()
+        # Only shut down services a game actually started; importing them here would just slow the exit
+        for name, closer in (("leaderboard", "close_leaderboard"), ("audio", "close_audio")):
+            module = sys.modules.get(name)
+            if module is not None:
+                getattr(module, closer)()
+        self.root.quit()
+
+def main():
+    root = tk.Tk()
+    app = App(root)
+    app.show("menu")
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# Sound effects and music played from a background thread, so the Tk thread never waits
+# on audio. Sounds are decoded once when the engine starts and kept in memory.
+import atexit
+import os
+import queue
+import sys
+import threading
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+CLICK_FILE = os.path.join(ASSETS_DIR, "click.mp3")
+MUSIC_FILE = os.path.join(ASSETS_DIR, "8bit_theme.wav")
+BACKENDS = ["auto", "pygame", "winsound", "null"]
+
+class NullBackend:
+    # Used headless, when audio is off, or when no backend can be loaded
+    name = "null"
+
+    def load(self):
+        pass
+
+    def play_click(self):
+        pass
+
+    def start_music(self):
+        pass
+
+    def stop_music(self):
+        pass
+
+    def set_volume(self, volume):
+        pass
+
+    def close(self):
+        pass
+
+class PygameBackend:
+    # pygame decodes the MP3/WAV files into memory and SDL mixes them on its own thread
+    name = "pygame"
+
+    def __init__(self):
+        import pygame.mixer
+        self.mixer = pygame.mixer
+        self.click = None
+        self.music = None
+        self.volume = 1.0
+
+    def load(self):
+        self.mixer.init()
+        if os.path.exists(CLICK_FILE):
+            self.click = self.mixer.Sound(CLICK_FILE)
+        if os.path.exists(MUSIC_FILE):
+            self.music = self.mixer.Sound(MUSIC_FILE)
+        self.set_volume(self.volume)
+
+    def play_click(self):
+        if self.click is not None:
+            self.click.play()
+
+    def start_music(self):
+        if self.music is not None and self.music.get_num_channels() == 0:
+            self.music.play(loops=-1)
+
+    def stop_music(self):
+        if self.music is not None:
+            self.music.stop()
+
+    def set_volume(self, volume):
+        self.volume = volume
+        for sound in (self.click, self.music):
+            if sound is not None:
+                sound.set_volume(volume)
+
+    def close(self):
+        self.mixer.quit()
+
+class WinsoundBackend:
+    # Windows fallback without pygame: a short beep for clicks and looping WAV music.
+    # Beep blocks, but only the audio thread; winsound has no volume control.
+    name = "winsound"
+
+    def __init__(self):
+        import winsound
+        self.winsound = winsound
+
+    def load(self):
+        pass
+
+    def play_click(self):
+        self.winsound.Beep(600, 100)
+
+    def start_music(self):
+        if os.path.exists(MUSIC_FILE):
+            self.winsound.PlaySound(MUSIC_FILE, self.winsound.SND_FILENAME | self.winsound.SND_ASYNC | self.winsound.SND_LOOP)
+
+    def stop_music(self):
+        self.winsound.PlaySound(None, 0)
+
+    def set_volume(self, volume):
+        pass
+
+    def close(self):
+        self.stop_music()
+
+def create_backend(name="auto"):
+    candidates = {"pygame": [PygameBackend], "winsound": [WinsoundBackend], "null": []}.get(name)
+    if candidates is None:
+        candidates = [PygameBackend] + ([WinsoundBackend] if sys.platform == "win32" else [])
+    for backend in candidates:
+        try:
+            return backend()
+        except ImportError:
+            continue
+    return NullBackend()
+
+_STOP = object()
+
+class AudioEngine:
+    def __init__(self, backend=None, volume=70):
+        self.backend = backend or NullBackend()
+        self.commands = queue.Queue()
+        self.set_volume(volume)
+        self.thread = threading.Thread(target=self.run, name="audio", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        try:
+            self.backend.load()
+        except Exception:
+            # A missing audio device must not take the game down with it
+            self.backend = NullBackend()
+        while True:
+            command = self.commands.get()
+            if command is _STOP:
+                break
+            method, args = command
+            try:
+                getattr(self.backend, method)(*args)
+            except Exception:
+                pass
+        self.backend.close()
+
+    def send(self, method, *args):
+        self.commands.put((method, args))
+
+    def play_click(self):
+        self.send("play_click")
+
+    def start_music(self):
+        self.send("start_music")
+
+    def stop_music(self):
+        self.send("stop_music")
+
+    def set_volume(self, volume):
+        # volume is the 0-100 value from settings
+        self.send("set_volume", max(0, min(volume, 100)) / 100)
+
+    def close(self):
+        if self.thread.is_alive():
+            self.commands.put(_STOP)
+            self.thread.join(timeout=1.0)
+
+_audio = None
+
+def get_audio(backend="auto", volume=70):
+    global _audio
+    if _audio is None:
+        _audio = AudioEngine(create_backend(backend), volume)
+        atexit.register(_audio.close)
+    return _audio
+
+def close_audio():
+    global _audio
+    if _audio is not None:
+        _audio.close()
+        _audio = None
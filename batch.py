@@ -0,0 +1,59 @@
+# Vectorized analysis of many boards at once. Boards are rows of an (M, N*N) integer
+# array with 0 for an empty square, 1 for X and 2 for O.
+import numpy as np
+from board import Board, get_rules
+
+EMPTY, X, O = 0, 1, 2
+PLAYER_CODES = {"X": X, "O": O}
+
+def board_size(boards):
+    size = int(round(boards.shape[1] ** 0.5))
+    if size * size != boards.shape[1]:
+        raise ValueError(f"{boards.shape[1]} squares is not a square board")
+    return size
+
+def line_index(size, k):
+    return np.array(get_rules(size, k).lines, dtype=np.intp)
+
+def to_array(boards):
+    # Accepts Board objects or lists of "", "X", "O"
+    rows = [board.to_list() if isinstance(board, Board) else board for board in boards]
+    codes = {"": EMPTY, "X": X, "O": O}
+    return np.array([[codes[cell] for cell in row] for row in rows], dtype=np.int8)
+
+def winners(boards, k=3):
+    # 0 for no winner, otherwise the code of the player with a completed line
+    boards = np.asarray(boards)
+    cells = boards[:, line_index(board_size(boards), k)]  # (M, lines, k)
+    result = np.zeros(len(boards), dtype=np.int8)
+    for code in (O, X):
+        result[(cells == code).all(axis=2).any(axis=1)] = code
+    return result
+
+def legal_moves(boards):
+    return np.asarray(boards) == EMPTY
+
+def winning_moves(boards, player, k=3):
+    # (M, N) mask of empty squares that would complete a line for `player`
+    boards = np.asarray(boards)
+    code = PLAYER_CODES.get(player, player)
+    lines = line_index(board_size(boards), k)
+    cells = boards[:, lines]
+    empty = cells == EMPTY
+    ready = ((cells == code).sum(axis=2) == k - 1) & (empty.sum(axis=2) == 1)
+    board_idx, line_idx, slot_idx = np.nonzero(ready[:, :, None] & empty)
+    result = np.zeros(boards.shape, dtype=bool)
+    result[board_idx, lines[line_idx, slot_idx]] = True
+    return result
+
+def first_move(mask):
+    # Lowest square set in each row of a move mask, or -1 when there is none
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), -1)
+
+def win_moves(boards, player, k=3):
+    return first_move(winning_moves(boards, player, k))
+
+def block_moves(boards, ai_player, k=3):
+    # The square medium difficulty plays to stop the opponent winning next turn, or -1
+    opponent = "X" if ai_player == "O" else "O"
+    return first_move(winning_moves(boards, opponent, k))
@@ -0,0 +1,200 @@
+# Headless benchmarks for the AI and rules hot paths: python bench_ai.py --out bench_results.json
+# Compare against an earlier run with --baseline old.json. Needs no tkinter or display.
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from ai import TicTacToeAI
+from board import Board
+from engine import GameEngine
+from selfplay import ALL_DIFFICULTIES, DIFFICULTIES, play_game
+
+# Fixed 3x3 positions, square 0 top-left, '.' empty. The side with fewer marks moves, X on a tie.
+OPENINGS = ["." * i + "X" + "." * (8 - i) for i in range(9)]
+MIDGAMES = [
+    "X...O...X",
+    "XO..X....",
+    "..X.O.X..",
+    "O..XX....",
+    "X.O.O.X..",
+    ".X.XO.O..",
+]
+NEAR_TERMINAL = [
+    "XOXXOO.X.",
+    "XOX.OXO..",
+    "OXOXX.XO.",
+    "XXO.OX..O",
+]
+POSITIONS = [("empty", "." * 9)] + [(f"opening-{i}", p) for i, p in enumerate(OPENINGS)] \
+    + [(f"midgame-{i}", p) for i, p in enumerate(MIDGAMES)] \
+    + [(f"endgame-{i}", p) for i, p in enumerate(NEAR_TERMINAL)]
+
+# Finished boards as well as open ones, so both outcomes of the win check are timed
+WINNER_BOARDS = [p for _, p in POSITIONS] + ["XXXOO....", "O..XO.X.O", "XOXXOOXXO", "..X.X.XOO"]
+
+MATCHUPS = [("easy", "easy"), ("medium", "medium"), ("hard", "hard"), ("hard", "easy"), ("medium", "hard")]
+
+def parse(position):
+    return Board.from_list(["" if c == "." else c for c in position])
+
+def to_move(position):
+    return "O" if position.count("X") > position.count("O") else "X"
+
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def measure(name, group, call, calls, setup=None):
+    # Timing pass first, then a separate tracemalloc pass so tracing overhead stays out of the latencies
+    if setup:
+        setup()
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(calls):
+        start = clock()
+        call()
+        samples.append(clock() - start)
+    total = sum(samples)
+    samples.sort()
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        for _ in range(max(1, calls // 10)):
+            call()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "group": group,
+        "calls": calls,
+        "ops_per_sec": calls / (total / 1e9) if total else float("inf"),
+        "p50_us": percentile(samples, 0.50) / 1000,
+        "p99_us": percentile(samples, 0.99) / 1000,
+        "peak_kib": peak / 1024,
+    }
+
+def clear_ai_caches():
+    # Each case starts cold; later calls in the case hit the caches as they would in a real game
+    TicTacToeAI.transposition_table.clear()
+    TicTacToeAI.position_cache.clear()
+
+def bench_get_move(difficulties, calls, seed):
+    results = []
+    for difficulty in difficulties:
+        for name, position in POSITIONS:
+            board = parse(position)
+            ai = TicTacToeAI(ai_player=to_move(position), difficulty=difficulty, rng=random.Random(seed))
+            results.append(measure(f"get_move[{difficulty}] {name}", "get_move",
+                                   lambda: ai.get_move(board), calls, setup=clear_ai_caches))
+    return results
+
+def bench_check_winner(calls):
+    ai = TicTacToeAI()
+    lists = [["" if c == "." else c for c in p] for p in WINNER_BOARDS]
+    boards = [parse(p) for p in WINNER_BOARDS]
+
+    def ai_on_lists():
+        for cells in lists:
+            ai.check_winner(cells, "X")
+            ai.check_winner(cells, "O")
+
+    def ai_on_boards():
+        for board in boards:
+            ai.check_winner(board, "X")
+            ai.check_winner(board, "O")
+
+    def game_check():
+        # TicTacToe.check_winner is board.winning_line(); called directly so tkinter is not needed
+        for board in boards:
+            board.winning_line()
+
+    per_call = len(WINNER_BOARDS)
+    results = [
+        measure("ai.check_winner list", "check_winner", ai_on_lists, calls),
+        measure("ai.check_winner board", "check_winner", ai_on_boards, calls),
+        measure("game.check_winner", "check_winner", game_check, calls),
+    ]
+    for result in results:
+        # Report per board checked rather than per batch
+        result["ops_per_sec"] *= per_call
+        result["p50_us"] /= per_call
+        result["p99_us"] /= per_call
+    return results
+
+def bench_selfplay(matchups, games, seed):
+    results = []
+    for x_difficulty, o_difficulty in matchups:
+        rng = random.Random(seed)
+        engine = GameEngine(rng=rng)
+        players = {
+            "X": TicTacToeAI(ai_player="X", difficulty=x_difficulty, rng=rng),
+            "O": TicTacToeAI(ai_player="O", difficulty=o_difficulty, rng=rng),
+        }
+        results.append(measure(f"selfplay {x_difficulty} vs {o_difficulty}", "selfplay",
+                               lambda: play_game(engine, players), games, setup=clear_ai_caches))
+    return results
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def format_results(results, baseline=None):
+    previous = {r["name"]: r for r in baseline["results"]} if baseline else {}
+    lines = [f"{'benchmark':<36} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10} {'peak KiB':>9}" + ("  vs baseline" if previous else "")]
+    for r in results:
+        line = f"{r['name']:<36} {r['ops_per_sec']:>12,.0f} {r['p50_us']:>10.1f} {r['p99_us']:>10.1f} {r['peak_kib']:>9.1f}"
+        if r["name"] in previous:
+            ratio = r["ops_per_sec"] / previous[r["name"]]["ops_per_sec"]
+            line += f"  {ratio:>6.2f}x"
+        lines.append(line)
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark AI move selection, win checks and self-play without a display.")
+    parser.add_argument("--difficulties", nargs="+", choices=ALL_DIFFICULTIES, default=DIFFICULTIES)
+    parser.add_argument("--calls", type=int, default=200, help="timed calls per get_move position")
+    parser.add_argument("--winner-calls", type=int, default=20000, help="timed batches per check_winner benchmark")
+    parser.add_argument("--games", type=int, default=200, help="self-play games per matchup")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    parser.add_argument("--baseline", default=None, help="earlier JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    matchups = [m for m in MATCHUPS if set(m) <= set(args.difficulties)]
+    started = time.time()
+    results = bench_get_move(args.difficulties, args.calls, args.seed)
+    results += bench_check_winner(args.winner_calls)
+    results += bench_selfplay(matchups, args.games, args.seed)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print(format_results(results, baseline))
+
+    if args.out:
+        report = {
+            "timestamp": started,
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "args": vars(args),
+            "results": results,
+        }
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"results written to {args.out}")
+
+if __name__ == "__main__":
+    main()
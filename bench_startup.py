@@ -0,0 +1,123 @@
+# Cold-start benchmark: python bench_startup.py
+# Fails (exit status 1) when importing the app or drawing the first menu frame goes over budget,
+# or when a module that should load lazily is pulled in at startup.
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+IMPORT_BUDGET_MS = 60.0
+FIRST_FRAME_BUDGET_MS = 500.0
+
+# Only needed once a game, the leaderboard or the options screen is opened
+LAZY_MODULES = ["ai", "ai_worker", "book", "symmetry", "audio", "leaderboard", "sqlite3", "records",
+                "game", "setup_window", "options_window", "leaderboard_window", "multiprocessing", "numpy"]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def parse_importtime(stderr):
+    # Lines look like "import time:  self [us] | cumulative | <indent>name"; nesting is shown by indent
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+def measure_import(module="app"):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=HERE, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    entries = parse_importtime(result.stderr)
+    total = next(cumulative for name, _, cumulative, depth in entries if name == module and depth == 0)
+    return total / 1000, entries
+
+def first_frame_child():
+    start = time.perf_counter()
+    import tkinter as tk
+    from app import App
+    imported = time.perf_counter()
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        print(json.dumps({"error": str(exc)}), flush=True)
+        return
+    app = App(root)
+    app.show("menu")
+    root.update()
+    drawn = time.perf_counter()
+    print(json.dumps({
+        "import_ms": (imported - start) * 1000,
+        "frame_ms": (drawn - start) * 1000,
+        "modules": sorted(sys.modules),
+    }), flush=True)
+    root.destroy()
+
+def measure_first_frame():
+    # Timed from the parent so interpreter start-up counts too
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--child"],
+                             cwd=HERE, stdout=subprocess.PIPE, text=True)
+    line = child.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000
+    child.communicate()
+    report = json.loads(line) if line else {"error": f"child exited with status {child.returncode}"}
+    report["wall_ms"] = elapsed
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check cold-start import time and time to the first menu frame.")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS, help="ms allowed for 'import app'")
+    parser.add_argument("--frame-budget", type=float, default=FIRST_FRAME_BUDGET_MS, help="ms allowed until the menu is drawn")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the fastest is kept")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--require-display", action="store_true", help="fail instead of skipping the frame check without a display")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        first_frame_child()
+        return 0
+
+    failures = []
+    # The first run writes bytecode caches; best-of-N keeps scheduler noise out of the result
+    measure_import()
+    runs = [measure_import() for _ in range(args.repeat)]
+    import_ms, entries = min(runs, key=lambda run: run[0])
+    print(f"import app: {import_ms:.1f} ms (budget {args.import_budget:.0f} ms, best of {args.repeat})")
+    for name, self_us, cumulative_us, depth in sorted(entries, key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:>7.2f} ms self  {cumulative_us / 1000:>7.2f} ms total  {name}")
+    if import_ms > args.import_budget:
+        failures.append(f"import app took {import_ms:.1f} ms")
+
+    eager = sorted({name for name, *_ in entries} & set(LAZY_MODULES))
+    if eager:
+        failures.append("imported at startup: " + ", ".join(eager))
+
+    frames = [measure_first_frame() for _ in range(args.repeat)]
+    errors = [frame["error"] for frame in frames if "error" in frame]
+    if errors:
+        print(f"first frame: skipped ({errors[0]})")
+        if args.require_display:
+            failures.append("no display for the first-frame check")
+    else:
+        best = min(frames, key=lambda frame: frame["wall_ms"])
+        print(f"first frame: {best['wall_ms']:.1f} ms wall, {best['frame_ms']:.1f} ms in process "
+              f"(budget {args.frame_budget:.0f} ms, best of {args.repeat})")
+        if best["wall_ms"] > args.frame_budget:
+            failures.append(f"first frame took {best['wall_ms']:.1f} ms")
+        eager = sorted(set(best["modules"]) & set(LAZY_MODULES))
+        if eager:
+            failures.append("loaded before the first frame: " + ", ".join(eager))
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
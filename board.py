@@ -0,0 +1,191 @@
+# Compact N x N, K-in-a-row board: one bit mask per player, bit i set when square i is taken.
+from functools import lru_cache
+
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]  # across, down, diagonal, anti-diagonal
+
+class Rules:
+    def __init__(self, size=3, k=3):
+        if not 1 <= k <= size:
+            raise ValueError(f"win length {k} does not fit a {size}x{size} board")
+        self.size = size
+        self.k = k
+        self.cells = size * size
+        self.full_mask = (1 << self.cells) - 1
+        self.lines = []
+        for row in range(size):
+            for col in range(size):
+                for d_row, d_col in DIRECTIONS:
+                    end_row = row + d_row * (k - 1)
+                    end_col = col + d_col * (k - 1)
+                    if 0 <= end_row < size and 0 <= end_col < size:
+                        self.lines.append([(row + d_row * j) * size + col + d_col * j for j in range(k)])
+        self.line_masks = [sum(1 << i for i in line) for line in self.lines]
+        # Lines through each square, so a move only has to check its own lines
+        self.lines_through = [[] for _ in range(self.cells)]
+        for line, mask in zip(self.lines, self.line_masks):
+            for i in line:
+                self.lines_through[i].append((line, mask))
+        self.masks_through = [[mask for _, mask in through] for through in self.lines_through]
+        # Squares touching each square, used to keep search near the stones on big boards
+        self.neighbors = []
+        for i in range(self.cells):
+            row, col = divmod(i, size)
+            mask = 0
+            for n_row in range(max(0, row - 1), min(size, row + 2)):
+                for n_col in range(max(0, col - 1), min(size, col + 2)):
+                    mask |= 1 << (n_row * size + n_col)
+            self.neighbors.append(mask & ~(1 << i))
+
+    def __reduce__(self):
+        # Unpickle to the shared instance, so identity checks like Board.is_classic hold in worker processes
+        return get_rules, (self.size, self.k)
+
+    def has_win(self, mask):
+        for win in self.line_masks:
+            if mask & win == win:
+                return True
+        return False
+
+    def wins_through(self, mask, index):
+        for win in self.masks_through[index]:
+            if mask & win == win:
+                return True
+        return False
+
+@lru_cache(maxsize=None)
+def get_rules(size=3, k=3):
+    return Rules(size, k)
+
+CLASSIC = get_rules(3, 3)
+WIN_LINES = CLASSIC.lines
+WIN_MASKS = CLASSIC.line_masks
+FULL_MASK = CLASSIC.full_mask
+
+def has_win(mask):
+    # 3x3 fast path used by the solver and the opening book
+    for win in WIN_MASKS:
+        if mask & win == win:
+            return True
+    return False
+
+def iter_bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def popcount(mask):
+    return bin(mask).count("1")
+
+class Board:
+    __slots__ = ("x_mask", "o_mask", "rules")
+
+    def __init__(self, x_mask=0, o_mask=0, size=3, k=3, rules=None):
+        self.x_mask = x_mask
+        self.o_mask = o_mask
+        self.rules = rules or get_rules(size, k)
+
+    @classmethod
+    def from_list(cls, cells, size=None, k=3):
+        if size is None:
+            size = int(len(cells) ** 0.5)
+        board = cls(size=size, k=k)
+        for i, cell in enumerate(cells):
+            if cell:
+                board.play(i, cell)
+        return board
+
+    @property
+    def size(self):
+        return self.rules.size
+
+    @property
+    def k(self):
+        return self.rules.k
+
+    def is_classic(self):
+        return self.rules is CLASSIC
+
+    def to_list(self):
+        return [self[i] for i in range(self.rules.cells)]
+
+    def copy(self):
+        return Board(self.x_mask, self.o_mask, rules=self.rules)
+
+    def mask(self, player):
+        return self.x_mask if player == "X" else self.o_mask
+
+    def empty_mask(self):
+        return self.rules.full_mask & ~(self.x_mask | self.o_mask)
+
+    def empty_squares(self):
+        return list(iter_bits(self.empty_mask()))
+
+    def is_empty(self, index):
+        return not (self.x_mask | self.o_mask) >> index & 1
+
+    def is_full(self):
+        return (self.x_mask | self.o_mask) == self.rules.full_mask
+
+    def play(self, index, player):
+        # Places a stone and reports whether it completed a line, checking only lines through it
+        if player == "X":
+            self.x_mask |= 1 << index
+            return self.rules.wins_through(self.x_mask, index)
+        self.o_mask |= 1 << index
+        return self.rules.wins_through(self.o_mask, index)
+
+    def undo(self, index):
+        bit = ~(1 << index)
+        self.x_mask &= bit
+        self.o_mask &= bit
+
+    def is_winner(self, player):
+        return self.rules.has_win(self.mask(player))
+
+    def would_win(self, index, player):
+        return self.rules.wins_through(self.mask(player) | 1 << index, index)
+
+    def line_through(self, index):
+        # Completed line through `index`, if the stone there is part of one
+        mask = self.x_mask if self.x_mask >> index & 1 else self.o_mask
+        for line, win in self.rules.lines_through[index]:
+            if mask & win == win:
+                return line
+        return None
+
+    def winning_line(self):
+        for line, win in zip(self.rules.lines, self.rules.line_masks):
+            if self.x_mask & win == win or self.o_mask & win == win:
+                return line
+        return None
+
+    # List adapters so code written against the old list-of-strings board keeps working
+    def __getitem__(self, index):
+        if self.x_mask >> index & 1:
+            return "X"
+        if self.o_mask >> index & 1:
+            return "O"
+        return ""
+
+    def __setitem__(self, index, player):
+        self.undo(index)
+        if player:
+            self.play(index, player)
+
+    def __len__(self):
+        return self.rules.cells
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __eq__(self, other):
+        if isinstance(other, Board):
+            return self.x_mask == other.x_mask and self.o_mask == other.o_mask and self.rules is other.rules
+        return self.to_list() == list(other)
+
+    def __hash__(self):
+        return hash((self.x_mask, self.o_mask, self.rules.size, self.rules.k))
+
+    def __repr__(self):
+        return f"Board({self.to_list()!r}, size={self.size}, k={self.k})"
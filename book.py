@@ -0,0 +1,92 @@
+# Solved-position table for 3x3 tic-tac-toe.
+#
+# Every board is encoded from the point of view of the side to move:
+# each square is 0 (empty), 1 (side to move) or 2 (opponent), read as a
+# base-3 number with square 0 as the lowest digit. Turns can be skipped on
+# timeout, so any piece count is reachable and all 3**9 codes are stored.
+# Each entry is two bytes: the best move (NO_MOVE if the position is over)
+# and the signed score for the side to move.
+#
+# Rebuild with: python book.py
+import mmap
+import os
+import struct
+from board import FULL_MASK, has_win, popcount
+
+BOOK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "perfect_play.bin")
+MAGIC = b"TTTBOOK1"
+ENTRY_SIZE = 2
+NUM_POSITIONS = 3 ** 9
+NO_MOVE = 255
+
+# Base-3 value of each 9-bit mask, so a board encodes with two lookups
+TERNARY = [sum(3 ** i for i in range(9) if mask >> i & 1) for mask in range(FULL_MASK + 1)]
+
+_book = None
+_book_loaded = False
+
+def encode(own, opp):
+    return TERNARY[own] + 2 * TERNARY[opp]
+
+def decode(code):
+    own = opp = 0
+    for i in range(9):
+        code, digit = divmod(code, 3)
+        if digit == 1:
+            own |= 1 << i
+        elif digit == 2:
+            opp |= 1 << i
+    return own, opp
+
+def load_book():
+    # Mapped on first use so importing the AI stays cheap
+    global _book, _book_loaded
+    if not _book_loaded:
+        _book_loaded = True
+        try:
+            with open(BOOK_FILE, "rb") as file:
+                book = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if book[:len(MAGIC)] == MAGIC and len(book) == len(MAGIC) + NUM_POSITIONS * ENTRY_SIZE:
+            _book = book
+        else:
+            book.close()
+    return _book
+
+def lookup(own, opp):
+    book = load_book()
+    if book is None:
+        return None
+    offset = len(MAGIC) + encode(own, opp) * ENTRY_SIZE
+    move, score = struct.unpack_from("Bb", book, offset)
+    return (None if move == NO_MOVE else move), score
+
+def build_book(path=BOOK_FILE):
+    from ai import TicTacToeAI
+
+    solver = TicTacToeAI()
+    table = bytearray(NUM_POSITIONS * ENTRY_SIZE)
+    for code in range(NUM_POSITIONS):
+        own, opp = decode(code)
+        empty = FULL_MASK & ~(own | opp)
+        if has_win(opp):
+            move, score = NO_MOVE, -(1 + popcount(empty))
+        elif has_win(own):
+            move, score = NO_MOVE, 1 + popcount(empty)
+        elif not empty:
+            move, score = NO_MOVE, 0
+        else:
+            move, score = solver.search_root(own, opp)
+        struct.pack_into("Bb", table, code * ENTRY_SIZE, move, score)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(table)
+    os.replace(tmp_path, path)
+    return solver.nodes_visited
+
+if __name__ == "__main__":
+    nodes = build_book()
+    print(f"Wrote {BOOK_FILE} ({NUM_POSITIONS} positions, {nodes} nodes searched)")
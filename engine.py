@@ -0,0 +1,83 @@
+# Headless game rules: turn order, timeout skips and results, with no tkinter dependency.
+import random
+from board import Board
+
+def other(player):
+    return "O" if player == "X" else "X"
+
+class GameEngine:
+    def __init__(self, board_size=3, win_length=3, skip_turn_on_timeout=True, starting_player=None, rng=None):
+        self.board_size = board_size
+        self.win_length = min(win_length, board_size)
+        self.skip_turn_on_timeout = skip_turn_on_timeout
+        self.rng = rng or random
+        self.reset(starting_player)
+
+    def reset(self, starting_player=None):
+        self.board = Board(size=self.board_size, k=self.win_length)
+        self.starting_player = starting_player or self.rng.choice(["X", "O"])
+        self.current_player = self.starting_player
+        self.winner = None
+        self.winning_line = None
+        self.draw = False
+        self.moves = []  # square indices in play order, None for a skipped turn
+
+    @property
+    def over(self):
+        return self.winner is not None or self.draw
+
+    @property
+    def result(self):
+        # 'X' or 'O' for a win, 'draw', or None while the game is running
+        if self.winner:
+            return self.winner
+        return "draw" if self.draw else None
+
+    def is_legal(self, index):
+        return not self.over and 0 <= index < len(self.board) and self.board.is_empty(index)
+
+    def play(self, index):
+        if not self.is_legal(index):
+            raise ValueError(f"illegal move {index} for {self.current_player}")
+        self.moves.append(index)
+        if self.board.play(index, self.current_player):
+            self.winner = self.current_player
+            self.winning_line = self.board.line_through(index)
+        elif self.board.is_full():
+            self.draw = True
+        else:
+            self.current_player = other(self.current_player)
+        return self.result
+
+    def snapshot(self):
+        return {
+            "board": self.board.to_list(),
+            "board_size": self.board_size,
+            "win_length": self.win_length,
+            "skip_turn_on_timeout": self.skip_turn_on_timeout,
+            "starting_player": self.starting_player,
+            "current_player": self.current_player,
+            "moves": list(self.moves)
+        }
+
+    @classmethod
+    def from_snapshot(cls, state):
+        engine = cls(state["board_size"], state["win_length"], state["skip_turn_on_timeout"],
+                     starting_player=state["starting_player"])
+        for move in state["moves"]:
+            if move is None:
+                engine.timeout()
+            else:
+                engine.play(move)
+        if engine.board.to_list() != state["board"] or engine.current_player != state["current_player"]:
+            raise ValueError("saved moves do not match the saved board")
+        return engine
+
+    def timeout(self):
+        # The clock ran out: pass the turn if the rules allow it, otherwise the same player goes again
+        if self.over:
+            return self.result
+        self.moves.append(None)
+        if self.skip_turn_on_timeout:
+            self.current_player = other(self.current_player)
+        return self.result
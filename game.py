@@ -1,33 +1,28 @@
 import tkinter as tk
 from tkinter import messagebox
-from ai import TicTacToeAI
+from engine import GameEngine, other
+from settings import load_settings, store as settings_store
+from resources import PIXEL_FONT_FAMILY, get_font, get_named_font
+from layout import BoardLayout
+from renderer import CanvasBoard
+from records import GameRecorder
+from savegame import GameSaver
+from notifications import NotificationCenter
+from timer import TurnClock
+import tracing
 import subprocess
 import sys
-import json
-import winsound
-import random
-import tkinter.font as tkFont
 import os
 
-SETTINGS_FILE = "settings.json"
-
-def load_settings():
-    try:
-        with open(SETTINGS_FILE, "r") as file:
-            return json.load(file)
-    except FileNotFoundError:
-        return {
-            "skip_turn_on_timeout": True,
-            "sound_effects": True,
-            "background_music": True,
-            "volume": 70,
-            "dark_mode": False,
-            "board_animation": True,
-            "language": "English",
-            "leaderboard_enabled": True,
-            "window_width": 600,
-            "window_height": 600
-        }
+AI_TIME_FRACTION = 0.5  # share of the turn clock the AI may spend searching
+TIMER_TICK = 100  # ms between timer label refreshes
+
+def open_leaderboard(settings):
+    # sqlite3 stays unloaded while the leaderboard is switched off
+    if not settings["leaderboard_enabled"]:
+        return None
+    from leaderboard import get_leaderboard
+    return get_leaderboard()
 
 def restart_index():
     subprocess.Popen([sys.executable, r"index.py"])
@@ -40,24 +35,35 @@ def center_window(root, width, height):
     root.geometry(f"{width}x{height}+{x}+{y}")
 
 def load_pixel_font(size=10):
-    return tkFont.Font(family="Press Start 2P", size=size)
+    return get_font(PIXEL_FONT_FAMILY, size)
 
 def animate_button_click(button):
     original_bg = button.cget("bg")
     button.configure(bg="white")
-    button.after(100, lambda: button.configure(bg=original_bg))
+    # Scheduled on the toplevel: the button's own after callbacks die with it when a
+    # click destroys its screen, and Tk would report an invalid command
+    def restore():
+        if button.winfo_exists():
+            button.configure(bg=original_bg)
+    button.winfo_toplevel().after(100, restore)
 
 class TicTacToe:
-    def __init__(self, root, mode, difficulty, player1_name, player2_name, player_symbol):
+    def __init__(self, root, mode, difficulty, player1_name, player2_name, player_symbol, app=None, resume_state=None):
         self.root = root
-        self.root.title("Tic-Tac-Toe Game")
+        self.app = app
+        self.window = root.winfo_toplevel()
+        self.window.title("Tic-Tac-Toe Game")
         self.settings = load_settings()
 
         width = self.settings.get("window_width", 600)
         height = self.settings.get("window_height", 600)
-        center_window(root, width, height)
+        center_window(self.window, width, height)
         root.configure(bg="#1e1e1e")
         self.pixel_font = load_pixel_font()
+        # Used for the board marks and resized in place as the window changes
+        self.board_font_size = 10
+        self.board_font = get_named_font("board", PIXEL_FONT_FAMILY, self.board_font_size)
+        self.board_font.configure(size=self.board_font_size)
 
         self.mode = mode
         self.difficulty = difficulty
@@ -66,142 +72,289 @@ class TicTacToe:
         self.player_symbol = player_symbol
         self.ai_symbol = "O" if player_symbol == "X" else "X"
         self.single_player = (mode == "single")
-        self.ai = TicTacToeAI(ai_player=self.ai_symbol, difficulty=difficulty) if self.single_player else None
-        self.current_player = random.choice(["X", "O"])
-
-        self.board = [""] * 9
-        self.buttons = []
+        self.time_limit = self.settings["turn_time"]
+        self.clock = TurnClock(self.time_limit, self.settings["time_increment"], self.settings["clock_mode"])
+        if resume_state and resume_state.get("clock_banks"):
+            self.clock.banks.update(resume_state["clock_banks"])
+        self.ai = None
+        self.ai_worker = None
+        if self.single_player:
+            # The search engine is only loaded for games that need it
+            from ai import TicTacToeAI
+            from ai_worker import AIWorker
+            self.ai = TicTacToeAI(ai_player=self.ai_symbol, difficulty=difficulty, time_budget=self.time_limit * AI_TIME_FRACTION,
+                                  iterations=self.settings["mcts_iterations"], workers=self.settings["mcts_workers"])
+            # MCTS keeps its tree between moves and runs its own process pool, so it always
+            # searches on a thread; a process worker would get a fresh copy of the AI every move
+            worker_kind = "thread" if difficulty == "mcts" else self.settings.get("ai_worker", "thread")
+            self.ai_worker = AIWorker(self.root, worker_kind)
+        if resume_state:
+            self.engine = GameEngine.from_snapshot(resume_state)
+        else:
+            self.engine = GameEngine(
+                board_size=self.settings.get("board_size", 3),
+                win_length=self.settings.get("win_length", 3),
+                skip_turn_on_timeout=self.settings["skip_turn_on_timeout"]
+            )
+        self.board_size = self.engine.board_size
+        self.renderer = None
+        self.recorder = GameRecorder()
+        self.saver = GameSaver()
+        self.leaderboard = open_leaderboard(self.settings)
 
-        self.time_limit = 5
-        self.remaining_time = self.time_limit
         self.timer_label = None
         self.timer_id = None
+        self.timer_due = None  # when the next tick should fire, for measuring drift while tracing
 
+        from audio import get_audio
+        self.audio = get_audio(self.settings["audio_backend"], self.settings["volume"])
+        self.audio.set_volume(self.settings["volume"])
         if self.settings["background_music"]:
             self.play_background_music()
 
+        self.notifications = NotificationCenter(self.root, font=self.pixel_font, enabled=self.settings["notifications"])
         self.create_menu()
         self.create_board()
-        self.create_timer()
+        self.create_timer(resume_state.get("remaining_time") if resume_state else None)
 
         if self.settings["dark_mode"]:
             self.apply_dark_mode()
 
-        self.root.bind("<Configure>", self.resize_grid)
+        self.layout = BoardLayout(self.root, self.board_size, self.resize_grid)
+        self.start_recording()
 
-        starter_name = self.player1_name if self.current_player == self.player_symbol else self.player2_name
-        messagebox.showinfo("Game Start", f"🎲 {starter_name} ({self.current_player}) starts!")
+        if resume_state:
+            for index, mark in enumerate(self.board):
+                self.renderer.set_mark(index, mark)
+        else:
+            self.save_state()
+            starter_name = self.player1_name if self.current_player == self.player_symbol else self.player2_name
+            self.notifications.notify(f"🎲 {starter_name} ({self.current_player}) starts!")
+
+        # Only once fully built: a rejected save raises above and must not leave a listener behind
+        self.unsubscribe_settings = settings_store.subscribe(self.on_settings_changed)
 
         if self.single_player and self.current_player == self.ai_symbol:
             self.ai_move()
 
-    def create_board(self):
-        for i in range(9):
-            button = tk.Button(
-                self.root,
-                text="",
-                font=self.pixel_font,
-                width=5,
-                height=2,
-                bg="#1e1e1e",
-                fg="#00f0ff",
-                activebackground="#00f0ff",
-                activeforeground="#1e1e1e",
-                command=lambda i=i: self.make_move(i)
-            )
-            button.grid(row=i // 3, column=i % 3, padx=5, pady=5, sticky="nsew")
-            self.buttons.append(button)
-
-        for i in range(3):
-            self.root.grid_rowconfigure(i, weight=1)
-            self.root.grid_columnconfigure(i, weight=1)
+    @property
+    def board(self):
+        return self.engine.board
 
-    def create_timer(self):
-        self.timer_label = tk.Label(self.root, text=f"Time Left: {self.remaining_time} s", font=self.pixel_font, fg="#00f0ff", bg="#1e1e1e")
-        self.timer_label.grid(row=4, column=0, columnspan=3)
-        self.start_timer()
+    @property
+    def current_player(self):
+        return self.engine.current_player
 
-    def start_timer(self):
-        self.remaining_time = self.time_limit
-        self.update_timer()
+    @property
+    def game_over(self):
+        return self.engine.over
 
+    def create_board(self):
+        self.renderer = CanvasBoard(self.root, self.board_size, self.on_cell_click, self.board_font)
+        self.renderer.canvas.grid(row=0, column=0, padx=5, pady=5)
+        self.root.grid_rowconfigure(0, weight=1)
+        self.root.grid_columnconfigure(0, weight=1)
+
+    def create_timer(self, remaining_time=None):
+        self.timer_label = tk.Label(self.root, text=f"Time Left: {self.time_limit:.1f} s", font=self.pixel_font, fg="#00f0ff", bg="#1e1e1e")
+        self.timer_label.grid(row=2, column=0)
+        self.start_timer(remaining_time)
+
+    def start_timer(self, remaining_time=None):
+        self.stop_timer()
+        self.clock.start(self.current_player, remaining_time)
+        self.timer_label.config(text=f"Time Left: {self.clock.remaining():.1f} s")
+        # Expiry is always handled from a later callback, never from inside a move or a skip
+        self.schedule_tick()
+
+    def schedule_tick(self):
+        delay = max(1, min(TIMER_TICK, int(self.clock.remaining() * 1000) + 1))
+        self.timer_id = self.root.after(delay, self.update_timer)
+        if tracing.ENABLED:
+            self.timer_due = tracing.now() + delay * 1000
+
+    @tracing.span("game.update_timer")
     def update_timer(self):
-        self.timer_label.config(text=f"Time Left: {self.remaining_time} s")
-        if self.remaining_time > 0:
-            self.remaining_time -= 1
-            self.timer_id = self.root.after(1000, self.update_timer)
-        else:
+        # The clock keeps real time; ticks only refresh the label, so late ticks can't add time
+        self.timer_id = None
+        if tracing.ENABLED and self.timer_due is not None:
+            tracing.counter("timer_drift_ms", (tracing.now() - self.timer_due) / 1000)
+        self.timer_label.config(text=f"Time Left: {self.clock.remaining():.1f} s")
+        if self.clock.poll():
             self.skip_turn()
+        else:
+            self.schedule_tick()
 
-    def stop_timer(self):
+    def cancel_tick(self):
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
             self.timer_id = None
+        self.timer_due = None
+
+    def stop_timer(self):
+        self.cancel_tick()
+        self.clock.stop()
+
+    def on_cell_click(self, index):
+        # Ignore clicks while the AI is thinking
+        if self.single_player and self.current_player == self.ai_symbol:
+            return
+        if tracing.ENABLED and self.board.is_empty(index) and not self.game_over:
+            # Click until the mark is on screen: the frame that draws it, then Tk's idle redraw
+            start = tracing.now()
+            self.renderer.after_render(lambda: self.root.after_idle(tracing.complete, "input_to_render", start))
+        self.make_move(index)
 
+    @tracing.span("game.make_move")
     def make_move(self, index):
-        if self.buttons[index]["text"] == "" and not self.check_winner():
+        if self.board.is_empty(index) and not self.game_over:
             self.stop_timer()
 
             if self.settings["sound_effects"]:
                 self.play_click_sound()
 
-            animate_button_click(self.buttons[index])
-            self.buttons[index]["text"] = self.current_player
-            self.board[index] = self.current_player
-            winning_line = self.check_winner()
+            self.renderer.flash_cell(index)
+            self.renderer.set_mark(index, self.current_player)
+            self.engine.play(index)
+            self.recorder.record_move(index)
+            if self.game_over:
+                self.recorder.end_game(self.engine.result)
+                self.saver.clear()
+                self.record_result()
+            winning_line = self.engine.winning_line
 
             if winning_line:
                 if self.settings["board_animation"]:
                     self.animate_winning_line(winning_line)
                 else:
                     self.show_winner_message()
-            elif "" not in self.board:
-                messagebox.showinfo("Game Over", "🤝 It's a draw!")
-                self.ask_play_again()
+            elif self.engine.draw:
+                self.ask_play_again("🤝 It's a draw!")
             else:
-                self.current_player = "O" if self.current_player == "X" else "X"
                 self.start_timer()
+                self.save_state()
                 if self.single_player and self.current_player == self.ai_symbol:
                     self.ai_move()
 
     def skip_turn(self):
+        self.cancel_ai()
+        if self.leaderboard:
+            self.leaderboard.record_skip(self.player_name(self.current_player), self.player_name(other(self.current_player)),
+                                         self.mode, self.leaderboard_difficulty(), self.board_size)
         if self.settings["skip_turn_on_timeout"]:
-            messagebox.showinfo("Turn Skipped", f"⏰ Time's up! {self.current_player}'s turn is skipped.")
-            self.current_player = "O" if self.current_player == "X" else "X"
+            self.notifications.notify(f"⏰ Time's up! {self.current_player}'s turn is skipped.")
+        self.engine.timeout()
+        self.recorder.record_skip()
         self.start_timer()
+        self.save_state()
         if self.single_player and self.current_player == self.ai_symbol:
             self.ai_move()
 
+    @tracing.span("game.ai_move")
     def ai_move(self):
-        move = self.ai.get_move(self.board)
-        if move is not None:
+        self.ai.time_budget = self.clock.remaining() * AI_TIME_FRACTION
+        self.ai_worker.submit(self.ai, self.board, self.on_ai_move)
+
+    def on_ai_move(self, move):
+        if move is not None and not self.game_over and self.current_player == self.ai_symbol:
             self.make_move(move)
 
+    def cancel_ai(self):
+        if self.ai_worker:
+            self.ai_worker.cancel()
+
+    def start_recording(self):
+        self.recorder.begin_game(self.engine, self.mode, self.difficulty if self.single_player else None,
+                                 self.player1_name, self.player2_name)
+        # A resumed game already has moves; log them so the record replays from the start
+        for move in self.engine.moves:
+            if move is None:
+                self.recorder.record_skip()
+            else:
+                self.recorder.record_move(move)
+
+    def player_name(self, symbol):
+        return self.player1_name if symbol == self.player_symbol else self.player2_name
+
+    def leaderboard_difficulty(self):
+        return self.difficulty if self.single_player else None
+
+    def record_result(self):
+        if not self.leaderboard:
+            return
+        names = (self.player_name("X"), self.player_name("O"))
+        if self.engine.draw:
+            self.leaderboard.record_draw(*names, self.mode, self.leaderboard_difficulty(), self.board_size)
+        else:
+            winner = self.engine.winner
+            self.leaderboard.record_game(self.player_name(winner), self.player_name(other(winner)),
+                                         self.mode, self.leaderboard_difficulty(), self.board_size)
+
+    def save_state(self):
+        state = self.engine.snapshot()
+        state.update(
+            mode=self.mode,
+            difficulty=self.difficulty,
+            player1_name=self.player1_name,
+            player2_name=self.player2_name,
+            player_symbol=self.player_symbol,
+            remaining_time=self.clock.remaining(),
+            clock_banks=dict(self.clock.banks)
+        )
+        self.saver.save(state)
+
+    def on_settings_changed(self, settings, changed):
+        # Sound, animation and timeout rules apply from the next move; board size from the next game
+        self.settings = settings
+        self.engine.skip_turn_on_timeout = settings["skip_turn_on_timeout"]
+        self.leaderboard = open_leaderboard(settings)
+        self.notifications.enabled = settings["notifications"]
+        if "volume" in changed:
+            self.audio.set_volume(settings["volume"])
+        if "background_music" in changed:
+            if settings["background_music"]:
+                self.play_background_music()
+            else:
+                self.audio.stop_music()
+
+    def shutdown(self):
+        self.unsubscribe_settings()
+        self.layout.cancel()
+        self.renderer.cancel()
+        self.notifications.clear()
+        if not self.game_over:
+            # The save resumes this game and logs it again in full, so this partial record is marked to skip
+            self.recorder.end_game("suspended")
+        self.recorder.close()
+        # Pausing is not a move: save the time left without finishing the turn, which would add an increment
+        self.cancel_tick()
+        if not self.game_over:
+            self.save_state()
+        self.saver.close()
+        self.audio.stop_music()
+        if self.ai_worker:
+            self.ai_worker.shutdown()
+
     def check_winner(self):
-        wins = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],
-            [0, 4, 8], [2, 4, 6]
-        ]
-        for line in wins:
-            if self.board[line[0]] == self.board[line[1]] == self.board[line[2]] != "":
-                return line
-        return None
+        return self.board.winning_line()
 
     def reset_game(self):
-        self.board = [""] * 9
-        for button in self.buttons:
-            button["text"] = ""
-        self.current_player = random.choice(["X", "O"])
+        self.cancel_ai()
+        self.engine.reset()
+        self.start_recording()
+        self.renderer.clear()
         starter_name = self.player1_name if self.current_player == self.player_symbol else self.player2_name
-        messagebox.showinfo("Game Restarted", f"🎲 {starter_name} ({self.current_player}) starts!")
+        self.notifications.clear()
+        self.notifications.notify(f"🎲 {starter_name} ({self.current_player}) starts!")
+        self.clock.reset()
         self.start_timer()
+        self.save_state()
         if self.single_player and self.current_player == self.ai_symbol:
             self.ai_move()
 
     def create_menu(self):
         menu_frame = tk.Frame(self.root, bg="#1e1e1e")
-        menu_frame.grid(row=3, column=0, columnspan=3, pady=10)
+        menu_frame.grid(row=1, column=0, pady=10)
 
         quit_button = tk.Button(menu_frame, text="Quit", font=self.pixel_font, bg="#00f0ff", fg="#1e1e1e")
         quit_button.config(command=lambda: [animate_button_click(quit_button), self.confirm_quit()])
@@ -212,67 +365,57 @@ class TicTacToe:
         return_button.pack(side=tk.LEFT, padx=10)
 
     def return_to_index(self):
-        self.root.destroy()
-        restart_index()
+        # With an app, App.end_game shuts this game down
+        if self.app:
+            self.app.show("menu")
+        else:
+            self.shutdown()
+            self.root.destroy()
+            restart_index()
 
-    def ask_play_again(self):
-        answer = messagebox.askyesno("Play Again", "Do you want to play again?")
-        if answer:
-            self.reset_game()
+    def quit_game(self):
+        if self.app:
+            self.app.quit()
         else:
+            self.shutdown()
             self.root.quit()
 
+    def ask_play_again(self, result_text):
+        # With notifications off (automated runs) a new game starts on its own after the result is drawn
+        self.notifications.prompt(f"{result_text} Play again?",
+                                  [("Yes", self.reset_game), ("No", self.quit_game)],
+                                  default=self.reset_game)
+
     def confirm_quit(self):
         answer = messagebox.askyesno("Quit", "Are you sure you want to quit the game?")
         if answer:
-            self.root.quit()
+            self.quit_game()
 
     def play_click_sound(self):
-        try:
-            winsound.Beep(600, 100)
-        except:
-            pass
+        self.audio.play_click()
 
     def play_background_music(self):
-        try:
-            winsound.PlaySound("8bit_theme.wav", winsound.SND_ASYNC | winsound.SND_LOOP)
-        except:
-            pass
+        self.audio.start_music()
 
     def apply_dark_mode(self):
         self.root.configure(bg="#1e1e1e")
-        for button in self.buttons:
-            button.configure(bg="#1e1e1e", fg="#00f0ff", activebackground="#00f0ff", activeforeground="#1e1e1e")
+        self.renderer.set_colors(background="#1e1e1e", cell="#1e1e1e", mark="#00f0ff")
         self.timer_label.configure(bg="#1e1e1e", fg="#00f0ff")
 
     def animate_winning_line(self, line):
-        def flash(count):
-            color = "yellow" if count % 2 == 0 else "white"
-            for idx in line:
-                self.buttons[idx].configure(bg=color)
-            if count < 5:
-                self.root.after(300, flash, count + 1)
-            else:
-                self.show_winner_message()
-        flash(0)
+        self.renderer.animate_win(line, self.show_winner_message)
 
     def show_winner_message(self):
         winner_name = self.player1_name if self.current_player == self.player_symbol else self.player2_name
-        messagebox.showinfo("Game Over", f"🎉 {winner_name} wins!")
-        self.ask_play_again()
+        self.ask_play_again(f"🎉 {winner_name} wins!")
 
-    def resize_grid(self, event):
-        if event.width < 300 or event.height < 300:
-            return
-
-        cell_width = event.width // 3
-        cell_height = (event.height - 150) // 3
-        cell_size = min(cell_width, cell_height)
+    @tracing.span("game.resize_grid")
+    def resize_grid(self, cell_size):
         font_size = max(10, min(cell_size // 3, 40))
-        resized_font = tkFont.Font(family="Press Start 2P", size=font_size)
-
-        for button in self.buttons:
-            button.config(width=cell_size // 10, height=cell_size // 30, font=resized_font)
+        if font_size != self.board_font_size:
+            self.board_font_size = font_size
+            self.board_font.configure(size=font_size)
+        self.renderer.resize(cell_size)
 
 def start_game(mode, difficulty, player1_name, player2_name, player_symbol):
     root = tk.Tk()
@@ -0,0 +1,51 @@
+# Turns bursts of <Configure> events into at most one board relayout per frame.
+FRAME_INTERVAL = 16  # ms, about 60 relayouts per second at most
+MIN_SIZE = 300
+RESERVED_HEIGHT = 150  # room below the board for the menu and timer
+
+class BoardLayout:
+    def __init__(self, widget, board_size, on_layout, min_size=MIN_SIZE, reserved_height=RESERVED_HEIGHT):
+        self.widget = widget
+        self.board_size = board_size
+        self.on_layout = on_layout  # called with the new cell size in pixels
+        self.min_size = min_size
+        self.reserved_height = reserved_height
+        self.width = None
+        self.height = None
+        self.cell_size = None
+        self.pending = None
+        self.event_count = 0
+        self.relayout_count = 0
+        widget.bind("<Configure>", self.on_configure, add="+")
+
+    def on_configure(self, event):
+        # Children report their own <Configure> through the toplevel's bindings; only
+        # the container's size matters here
+        if event.widget is not self.widget:
+            return
+        self.event_count += 1
+        self.width = event.width
+        self.height = event.height
+        if self.pending is None:
+            self.pending = self.widget.after(FRAME_INTERVAL, self.relayout)
+
+    def compute_cell_size(self, width, height):
+        if width < self.min_size or height < self.min_size:
+            return None
+        cell_width = width // self.board_size
+        cell_height = (height - self.reserved_height) // self.board_size
+        return min(cell_width, cell_height)
+
+    def relayout(self):
+        self.pending = None
+        cell_size = self.compute_cell_size(self.width, self.height)
+        if cell_size is None or cell_size == self.cell_size:
+            return
+        self.cell_size = cell_size
+        self.relayout_count += 1
+        self.on_layout(cell_size)
+
+    def cancel(self):
+        if self.pending is not None:
+            self.widget.after_cancel(self.pending)
+            self.pending = None
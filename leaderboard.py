@@ -0,0 +1,174 @@
+# Local SQLite leaderboard. One background thread owns the connection: writes are
+# queued and committed in batches, queries return futures the UI can wait on
+# without blocking the Tk loop.
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+LEADERBOARD_FILE = "leaderboard.db"
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.5  # seconds a write may wait for more to batch with
+POLL_INTERVAL = 30    # ms between checks for a finished query from Tk
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    opponent TEXT NOT NULL,
+    outcome TEXT NOT NULL CHECK (outcome IN ('win', 'loss', 'draw', 'skip')),
+    mode TEXT NOT NULL,
+    difficulty TEXT,
+    board_size INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_player ON results (player, played_at);
+CREATE INDEX IF NOT EXISTS idx_results_standings ON results (player, outcome, difficulty);
+CREATE INDEX IF NOT EXISTS idx_results_difficulty ON results (difficulty, played_at);
+CREATE INDEX IF NOT EXISTS idx_results_played_at ON results (played_at);
+"""
+
+# Fixed statements, compiled once and reused from sqlite3's statement cache
+INSERT_RESULT = """
+INSERT INTO results (player, opponent, outcome, mode, difficulty, board_size, played_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+TOP_PLAYERS = """
+SELECT player,
+       SUM(outcome = 'win') AS wins,
+       SUM(outcome = 'draw') AS draws,
+       SUM(outcome = 'loss') AS losses
+FROM results
+WHERE outcome != 'skip' AND (:difficulty IS NULL OR difficulty = :difficulty)
+GROUP BY player
+ORDER BY wins DESC, losses ASC, player ASC
+LIMIT :limit
+"""
+PLAYER_HISTORY = """
+SELECT opponent, outcome, mode, difficulty, board_size, played_at
+FROM results
+WHERE player = ?
+ORDER BY played_at DESC
+LIMIT ?
+"""
+WIN_RATE = """
+SELECT SUM(outcome = 'win'), SUM(outcome != 'skip')
+FROM results
+WHERE player = :player AND (:difficulty IS NULL OR difficulty = :difficulty)
+"""
+
+_STOP = object()
+
+class Leaderboard:
+    def __init__(self, path=LEADERBOARD_FILE):
+        self.path = path
+        self.tasks = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name="leaderboard", daemon=True)
+        self.thread.start()
+
+    # Writes: queued and committed together by the worker
+
+    def record_game(self, winner, loser, mode, difficulty, board_size):
+        now = time.time()
+        self.tasks.put(("write", [
+            (winner, loser, "win", mode, difficulty, board_size, now),
+            (loser, winner, "loss", mode, difficulty, board_size, now),
+        ]))
+
+    def record_draw(self, player1, player2, mode, difficulty, board_size):
+        now = time.time()
+        self.tasks.put(("write", [
+            (player1, player2, "draw", mode, difficulty, board_size, now),
+            (player2, player1, "draw", mode, difficulty, board_size, now),
+        ]))
+
+    def record_skip(self, player, opponent, mode, difficulty, board_size):
+        self.tasks.put(("write", [(player, opponent, "skip", mode, difficulty, board_size, time.time())]))
+
+    # Queries: each returns a concurrent.futures.Future
+
+    def top_players(self, limit=10, difficulty=None):
+        return self.query(TOP_PLAYERS, {"limit": limit, "difficulty": difficulty})
+
+    def player_history(self, player, limit=50):
+        return self.query(PLAYER_HISTORY, (player, limit))
+
+    def win_rate(self, player, difficulty=None):
+        future = Future()
+        counts = self.query(WIN_RATE, {"player": player, "difficulty": difficulty})
+
+        def done(result):
+            if result.exception() is not None:
+                future.set_exception(result.exception())
+                return
+            wins, games = result.result()[0]
+            future.set_result((wins or 0) / games if games else 0.0)
+        counts.add_done_callback(done)
+        return future
+
+    def query(self, sql, params=()):
+        future = Future()
+        self.tasks.put(("query", (sql, params, future)))
+        return future
+
+    def run(self):
+        connection = sqlite3.connect(self.path)
+        connection.executescript(SCHEMA)
+        pending = []
+        while True:
+            try:
+                task = self.tasks.get(timeout=FLUSH_INTERVAL if pending else None)
+            except queue.Empty:
+                task = None
+            if task is None or task is _STOP or task[0] == "query" or len(pending) >= BATCH_SIZE:
+                # Reads must see every earlier write, so flush before answering
+                if pending:
+                    with connection:
+                        connection.executemany(INSERT_RESULT, pending)
+                    pending = []
+            if task is None:
+                continue
+            if task is _STOP:
+                break
+            kind, payload = task
+            if kind == "write":
+                pending.extend(payload)
+            else:
+                sql, params, future = payload
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(connection.execute(sql, params).fetchall())
+                    except sqlite3.Error as error:
+                        future.set_exception(error)
+        connection.close()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.tasks.put(_STOP)
+            self.thread.join()
+
+def deliver(widget, future, callback):
+    # Calls callback(result) on the Tk thread once the future completes
+    def check():
+        if not future.done():
+            widget.after(POLL_INTERVAL, check)
+        elif not future.cancelled() and future.exception() is None:
+            callback(future.result())
+    check()
+
+_leaderboard = None
+
+def get_leaderboard():
+    global _leaderboard
+    if _leaderboard is None:
+        _leaderboard = Leaderboard()
+        atexit.register(_leaderboard.close)
+    return _leaderboard
+
+def close_leaderboard():
+    global _leaderboard
+    if _leaderboard is not None:
+        _leaderboard.close()
+        _leaderboard = None
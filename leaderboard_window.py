@@ -0,0 +1,60 @@
+import tkinter as tk
+from theme_utils import center_window, load_pixel_font, styled_button, get_current_theme
+from leaderboard import deliver, get_leaderboard
+
+TOP_N = 10
+
+class LeaderboardWindow:
+    def __init__(self, root, app=None):
+        self.root = root
+        self.app = app
+        self.window = root.winfo_toplevel()
+        self.window.title("Leaderboard")
+        center_window(self.window, 600, 600)
+        self.theme = get_current_theme()
+        root.configure(bg=self.theme["background"])
+        self.pixel_font = load_pixel_font()
+
+        tk.Label(root, text="Leaderboard", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=20)
+        self.rows_frame = tk.Frame(root, bg=self.theme["background"])
+        self.rows_frame.pack(pady=10)
+        styled_button(root, "Back to Main Menu", self.go_back).pack(pady=20)
+
+        if app is None:
+            self.on_show()
+
+    def on_show(self):
+        # Standings are read on the leaderboard thread and filled in when they arrive
+        self.show_message("Loading...")
+        deliver(self.root, get_leaderboard().top_players(TOP_N), self.show_rows)
+
+    def show_message(self, text):
+        for child in self.rows_frame.winfo_children():
+            child.destroy()
+        tk.Label(self.rows_frame, text=text, font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).grid(row=0, column=0)
+
+    def show_rows(self, rows):
+        if not self.rows_frame.winfo_exists():
+            return
+        if not rows:
+            self.show_message("No games recorded yet")
+            return
+        for child in self.rows_frame.winfo_children():
+            child.destroy()
+        headers = ["#", "Player", "W", "D", "L"]
+        for column, text in enumerate(headers):
+            tk.Label(self.rows_frame, text=text, font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).grid(row=0, column=column, padx=8, pady=4)
+        for rank, (player, wins, draws, losses) in enumerate(rows, start=1):
+            for column, value in enumerate([rank, player, wins, draws, losses]):
+                tk.Label(self.rows_frame, text=str(value), font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).grid(row=rank, column=column, padx=8, pady=2)
+
+    def go_back(self):
+        if self.app:
+            self.app.show("menu")
+        else:
+            self.root.quit()
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = LeaderboardWindow(root)
+    root.mainloop()
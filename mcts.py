@@ -0,0 +1,325 @@
+# Monte Carlo tree search (UCT) for any N x N, K-in-a-row board.
+#
+# Nodes live in parallel arrays indexed by node number rather than as Python
+# objects, about 30 bytes each. A node's children sit next to each other, so
+# a node only stores its first child and how many it has. Positions are not
+# stored: each iteration replays the moves from the root on a fresh board.
+#
+# Node values are from the point of view of the player whose move led to the
+# node: 1 for a win, 0.5 for a draw, 0 for a loss, summed over visits.
+import math
+import random
+import time
+from array import array
+from concurrent.futures import TimeoutError as FutureTimeout
+from board import Board, iter_bits
+
+DEFAULT_ITERATIONS = 5000  # per move when no time budget is given
+EXPLORATION = math.sqrt(2)
+MAX_NODES = 1_000_000  # past this the tree stops growing and only runs playouts
+TIME_CHECK_INTERVAL = 64  # iterations between clock reads
+RESULT_POLL = 0.05  # seconds between stop checks while waiting on parallel workers
+RESULT_GRACE = 0.25  # seconds a worker may overrun the deadline before its result is dropped
+
+ONGOING, WIN, DRAW = 0, 1, 2
+
+class NodeStore:
+    def __init__(self):
+        self.parent = array("i")
+        self.move = array("h")
+        self.first_child = array("i")
+        self.child_count = array("h")
+        self.visits = array("i")
+        self.value = array("d")
+        self.terminal = array("b")
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self, parent, move, visits=0, value=0.0, terminal=ONGOING):
+        self.parent.append(parent)
+        self.move.append(move)
+        self.first_child.append(-1)
+        self.child_count.append(0)
+        self.visits.append(visits)
+        self.value.append(value)
+        self.terminal.append(terminal)
+        return len(self.parent) - 1
+
+    def children(self, node):
+        first = self.first_child[node]
+        return range(first, first + self.child_count[node]) if first >= 0 else range(0)
+
+    def subtree(self, root):
+        # Copy the subtree under root into a fresh store, dropping everything else
+        store = NodeStore()
+        store.add(-1, self.move[root], self.visits[root], self.value[root], self.terminal[root])
+        pending = [(root, 0)]
+        while pending:
+            old, new = pending.pop()
+            if not self.child_count[old]:
+                continue
+            store.first_child[new] = len(store)
+            store.child_count[new] = self.child_count[old]
+            for child in self.children(old):
+                index = store.add(new, self.move[child], self.visits[child], self.value[child], self.terminal[child])
+                pending.append((child, index))
+        return store
+
+def other(player):
+    return "O" if player == "X" else "X"
+
+def expansion_moves(board):
+    # Small boards try every square; big ones only squares touching a stone
+    rules = board.rules
+    empty = board.empty_mask()
+    taken = rules.full_mask & ~empty
+    if rules.size <= 4:
+        return list(iter_bits(empty))
+    if not taken:
+        return [(rules.size // 2) * rules.size + rules.size // 2]
+    near = 0
+    for i in iter_bits(taken):
+        near |= rules.neighbors[i]
+    return list(iter_bits(near & empty))
+
+class MCTS:
+    def __init__(self, iterations=None, time_budget=None, workers=1, exploration=EXPLORATION,
+                 max_nodes=MAX_NODES, rng=None):
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.workers = workers
+        self.exploration = exploration
+        self.max_nodes = max_nodes
+        self.rng = rng or random.Random()
+        self.store = None
+        self.root_board = None
+        self.root_player = None
+        self.iterations_run = 0
+        self.reused_visits = 0
+
+    def reset(self):
+        self.store = None
+        self.root_board = None
+        self.root_player = None
+
+    def set_root(self, board, player):
+        # Keep the part of the last tree that still applies: our move, then maybe the opponent's
+        self.reused_visits = 0
+        if self.store is not None and self.root_board.rules is board.rules:
+            found = self.find_descendant(board, player)
+            if found is not None:
+                self.store = self.store.subtree(found)
+                self.reused_visits = self.store.visits[0]
+                self.root_board = board.copy()
+                self.root_player = player
+                return
+        self.store = NodeStore()
+        self.store.add(-1, -1)
+        self.root_board = board.copy()
+        self.root_player = player
+
+    def find_descendant(self, board, player):
+        target = (board.x_mask, board.o_mask)
+        if (self.root_board.x_mask, self.root_board.o_mask) == target:
+            return 0 if player == self.root_player else None
+        store = self.store
+        mover = self.root_player
+        for child in store.children(0):
+            after = self.root_board.copy()
+            after.play(store.move[child], mover)
+            if after.x_mask & ~board.x_mask or after.o_mask & ~board.o_mask:
+                continue
+            if (after.x_mask, after.o_mask) == target:
+                return child if player == other(mover) else None
+            for grandchild in store.children(child):
+                later = after.copy()
+                later.play(store.move[grandchild], other(mover))
+                if (later.x_mask, later.o_mask) == target:
+                    return grandchild if player == mover else None
+            return None
+        return None
+
+    def search(self, board, player, iterations=None, time_budget=None, stop_event=None):
+        # Grow the tree from (board, player to move) until the budget runs out
+        self.set_root(board, player)
+        if iterations is None and time_budget is None:
+            iterations = self.iterations
+            time_budget = self.time_budget
+        if iterations is None and time_budget is None:
+            iterations = DEFAULT_ITERATIONS
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        count = 0
+        while iterations is None or count < iterations:
+            if count % TIME_CHECK_INTERVAL == 0 and count:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                if stop_event is not None and stop_event.is_set():
+                    break
+            self.iterate()
+            count += 1
+        self.iterations_run = count
+        return count
+
+    def iterate(self):
+        store = self.store
+        board = self.root_board.copy()
+        player = self.root_player
+        node = 0
+        # Selection: follow UCT down to a leaf, playing the moves on the way
+        while store.terminal[node] == ONGOING:
+            if not store.child_count[node]:
+                if node and not store.visits[node]:
+                    break
+                if not self.expand(node, board):
+                    break
+            node = self.select(node)
+            if board.play(store.move[node], player):
+                store.terminal[node] = WIN
+            elif board.is_full():
+                store.terminal[node] = DRAW
+            player = other(player)
+
+        if store.terminal[node] == WIN:
+            result = 1.0
+        elif store.terminal[node] == DRAW:
+            result = 0.5
+        else:
+            result = self.rollout(board, player)
+
+        # Backpropagation, flipping the point of view at each level
+        while node >= 0:
+            store.visits[node] += 1
+            store.value[node] += result
+            result = 1.0 - result
+            node = store.parent[node]
+
+    def expand(self, node, board):
+        store = self.store
+        moves = expansion_moves(board)
+        if not moves or len(store) + len(moves) > self.max_nodes:
+            return False
+        self.rng.shuffle(moves)
+        store.first_child[node] = len(store)
+        store.child_count[node] = len(moves)
+        for move in moves:
+            store.add(node, move)
+        return True
+
+    def select(self, node):
+        store = self.store
+        log_visits = math.log(max(1, store.visits[node]))
+        visits = store.visits
+        value = store.value
+        best, best_score = -1, -1.0
+        for child in store.children(node):
+            n = visits[child]
+            if not n:
+                return child
+            score = value[child] / n + self.exploration * math.sqrt(log_visits / n)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def rollout(self, board, player):
+        # Random playout; the result is for the player who moved into the leaf
+        squares = list(iter_bits(board.empty_mask()))
+        self.rng.shuffle(squares)
+        mover = player
+        for square in squares:
+            if board.play(square, mover):
+                return 0.0 if mover == player else 1.0
+            mover = other(mover)
+        return 0.5
+
+    def root_stats(self):
+        # (move, visits, value) for each child of the root
+        store = self.store
+        return [(store.move[c], store.visits[c], store.value[c]) for c in store.children(0)]
+
+    def best_move(self, board, player, stop_event=None):
+        # Extra workers search their own trees from the same root; their root counts are summed
+        futures = []
+        generation = None
+        # Wall-clock deadline, since the workers' monotonic clocks need not match ours
+        deadline = time.time() + self.time_budget if self.time_budget is not None else None
+        if self.workers > 1:
+            pool, generation = start_generation(self.workers - 1)
+            for _ in range(self.workers - 1):
+                futures.append(pool.submit(search_worker, board.size, board.k, board.x_mask, board.o_mask, player,
+                                           self.iterations, deadline, self.exploration,
+                                           self.rng.getrandbits(64), generation))
+        self.search(board, player, stop_event=stop_event)
+        totals = {}
+        for move, visits, value in self.root_stats():
+            totals[move] = visits
+        for future in futures:
+            stats = collect(future, deadline, stop_event)
+            for move, visits, value in stats or ():
+                totals[move] = totals.get(move, 0) + visits
+        if generation is not None:
+            # Anything still running for this move stops at its next check instead of delaying the next one
+            cancel_generation(generation)
+        if not totals:
+            empty = board.empty_squares()
+            return empty[0] if empty else None
+        return max(totals, key=totals.get)
+
+class GenerationStop:
+    # Looks like a threading.Event to MCTS.search: set once the parent cancels this generation
+    def __init__(self, cancelled, generation):
+        self.cancelled = cancelled
+        self.generation = generation
+
+    def is_set(self):
+        return self.cancelled.value >= self.generation
+
+def search_worker(size, k, x_mask, o_mask, player, iterations, deadline, exploration, seed, generation):
+    # Module level so the process pool can pickle it
+    time_budget = max(0.0, deadline - time.time()) if deadline is not None else None
+    tree = MCTS(iterations, exploration=exploration, rng=random.Random(seed))
+    tree.search(Board(x_mask, o_mask, size, k), player, iterations, time_budget,
+                stop_event=GenerationStop(_cancelled, generation))
+    return tree.root_stats()
+
+def collect(future, deadline, stop_event):
+    # A worker's root stats, or None if the search was cancelled or the worker missed the deadline
+    while True:
+        if stop_event is not None and stop_event.is_set():
+            return None
+        wait = RESULT_POLL if deadline is None else min(RESULT_POLL, deadline + RESULT_GRACE - time.time())
+        if wait <= 0:
+            return None
+        try:
+            return future.result(timeout=wait)
+        except FutureTimeout:
+            continue
+
+_pool = None
+_pool_size = 0
+_cancelled = None  # shared generation counter: searches up to this number should stop
+_generation = 0
+
+def init_worker(cancelled):
+    global _cancelled
+    _cancelled = cancelled
+
+def start_generation(workers):
+    global _pool, _pool_size, _cancelled, _generation
+    if _pool is None or _pool_size != workers:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        # spawn, not fork: the game process already runs audio, saver and leaderboard threads
+        context = multiprocessing.get_context("spawn")
+        _cancelled = context.Value("q", _generation, lock=False)
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                    initializer=init_worker, initargs=(_cancelled,))
+        _pool_size = workers
+    _generation += 1
+    return _pool, _generation
+
+def cancel_generation(generation):
+    if _cancelled is not None and _cancelled.value < generation:
+        _cancelled.value = generation
@@ -0,0 +1,75 @@
+# Non-modal in-window banners. Messages queue up and show one at a time; plain
+# messages dismiss themselves, prompts wait for one of their buttons.
+from collections import deque
+import tkinter as tk
+
+DEFAULT_DURATION = 2000  # ms
+AUTO_ANSWER_DELAY = 500  # ms a prompt's default waits with notifications off, so the last frame is drawn first
+
+class NotificationCenter:
+    def __init__(self, parent, font=None, enabled=True, bg="#00f0ff", fg="#1e1e1e"):
+        self.parent = parent
+        self.font = font
+        self.enabled = enabled
+        self.bg = bg
+        self.fg = fg
+        self.queue = deque()
+        self.banner = None
+        self.dismiss_id = None
+        self.auto_id = None
+
+    def notify(self, text, duration=DEFAULT_DURATION):
+        if self.enabled:
+            self.queue.append((text, duration, None))
+            self.show_next()
+
+    def prompt(self, text, actions, default=None):
+        # actions: list of (label, callback). With notifications off (automated runs only,
+        # set in settings.json), `default` runs shortly after without waiting on a click
+        if not self.enabled:
+            if default:
+                self.auto_id = self.parent.after(AUTO_ANSWER_DELAY, lambda: self.auto_answer(default))
+            return
+        self.queue.append((text, None, actions))
+        self.show_next()
+
+    def show_next(self):
+        if self.banner is not None or not self.queue:
+            return
+        text, duration, actions = self.queue.popleft()
+        self.banner = tk.Frame(self.parent, bg=self.bg, bd=2, relief=tk.RIDGE)
+        tk.Label(self.banner, text=text, font=self.font, bg=self.bg, fg=self.fg).pack(padx=10, pady=6)
+        if actions:
+            row = tk.Frame(self.banner, bg=self.bg)
+            row.pack(pady=(0, 6))
+            for label, callback in actions:
+                tk.Button(row, text=label, font=self.font, bg=self.fg, fg=self.bg,
+                          command=lambda callback=callback: self.choose(callback)).pack(side=tk.LEFT, padx=5)
+        self.banner.place(relx=0.5, y=10, anchor="n")
+        self.banner.lift()
+        if duration is not None:
+            self.dismiss_id = self.parent.after(duration, self.dismiss)
+
+    def auto_answer(self, callback):
+        self.auto_id = None
+        callback()
+
+    def choose(self, callback):
+        self.dismiss()
+        callback()
+
+    def dismiss(self):
+        if self.dismiss_id is not None:
+            self.parent.after_cancel(self.dismiss_id)
+            self.dismiss_id = None
+        if self.banner is not None:
+            self.banner.destroy()
+            self.banner = None
+        self.show_next()
+
+    def clear(self):
+        self.queue.clear()
+        if self.auto_id is not None:
+            self.parent.after_cancel(self.auto_id)
+            self.auto_id = None
+        self.dismiss()
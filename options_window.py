@@ -2,22 +2,21 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 import subprocess
 import sys
-import json
 import shutil
-import os
 from theme_utils import center_window, load_pixel_font, styled_button, get_current_theme
-
-SETTINGS_FILE = "settings.json"
-SAVE_FILE = "tictactoe_save.json"
+from settings import SETTINGS_FILE, store as settings_store
+from savegame import clear_save
 
 def return_to_index():
     subprocess.Popen([sys.executable, r"index.py"])
 
 class OptionsWindow:
-    def __init__(self, root):
+    def __init__(self, root, app=None):
         self.root = root
-        self.root.title("Game Options")
-        center_window(root, 600, 600)
+        self.app = app
+        self.window = root.winfo_toplevel()
+        self.window.title("Game Options")
+        center_window(self.window, 600, 600)
         self.theme = get_current_theme()
         root.configure(bg=self.theme["background"])
         self.pixel_font = load_pixel_font()
@@ -39,13 +38,27 @@ class OptionsWindow:
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # The wheel is bound globally only while the pointer is over this canvas, so other screens keep theirs
+        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
+        self.canvas.bind("<Leave>", self._on_leave)
+        self.canvas.bind("<Destroy>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
 
         self.create_options_content()
 
     def _on_mousewheel(self, event):
+        if not self.canvas.winfo_ismapped():
+            return
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
+    def _on_leave(self, event):
+        # Moving onto one of the option widgets inside the canvas also counts as leaving it
+        try:
+            under = self.canvas.winfo_containing(event.x_root, event.y_root)
+        except KeyError:  # a Tk-internal window tkinter has no wrapper for
+            under = None
+        if under is None or not str(under).startswith(str(self.canvas)):
+            self.canvas.unbind_all("<MouseWheel>")
+
     def create_options_content(self):
         # Theme Selector
         tk.Label(self.scrollable_frame, text="Choose Theme", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
@@ -98,6 +111,46 @@ class OptionsWindow:
         self.window_height.set(self.settings.get("window_height", 600))
         self.window_height.pack()
 
+        # Board Variant
+        tk.Label(self.scrollable_frame, text="Board Size", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
+        self.board_size = tk.Scale(self.scrollable_frame, from_=3, to=15, orient=tk.HORIZONTAL, bg="#333", fg=self.theme["font_color"], troughcolor="#555")
+        self.board_size.set(self.settings.get("board_size", 3))
+        self.board_size.pack()
+
+        tk.Label(self.scrollable_frame, text="Marks in a Row to Win", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
+        self.win_length = tk.Scale(self.scrollable_frame, from_=3, to=15, orient=tk.HORIZONTAL, bg="#333", fg=self.theme["font_color"], troughcolor="#555")
+        self.win_length.set(self.settings.get("win_length", 3))
+        self.win_length.pack()
+
+        # Turn Clock
+        tk.Label(self.scrollable_frame, text="Seconds per Turn", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
+        self.turn_time = tk.Scale(self.scrollable_frame, from_=1, to=60, resolution=0.5, orient=tk.HORIZONTAL, bg="#333", fg=self.theme["font_color"], troughcolor="#555")
+        self.turn_time.set(self.settings["turn_time"])
+        self.turn_time.pack()
+
+        tk.Label(self.scrollable_frame, text="Increment per Move (s, Fischer only)", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
+        self.time_increment = tk.Scale(self.scrollable_frame, from_=0, to=10, resolution=0.5, orient=tk.HORIZONTAL, bg="#333", fg=self.theme["font_color"], troughcolor="#555")
+        self.time_increment.set(self.settings["time_increment"])
+        self.time_increment.pack()
+
+        tk.Label(self.scrollable_frame, text="Clock Mode", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
+        self.clock_mode = tk.StringVar(value=self.settings["clock_mode"])
+        tk.OptionMenu(self.scrollable_frame, self.clock_mode, "per_turn", "fischer").pack()
+        # Per-turn clocks reset every turn, so there is nothing for an increment to add to
+        self.clock_mode.trace_add("write", lambda *args: self.update_increment_state())
+        self.update_increment_state()
+
+        # MCTS difficulty: each move stops at the playout budget or half the turn clock, whichever comes first
+        tk.Label(self.scrollable_frame, text="MCTS Playouts per Move", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
+        self.mcts_iterations = tk.Scale(self.scrollable_frame, from_=500, to=50000, resolution=500, orient=tk.HORIZONTAL, bg="#333", fg=self.theme["font_color"], troughcolor="#555")
+        self.mcts_iterations.set(self.settings["mcts_iterations"])
+        self.mcts_iterations.pack()
+
+        tk.Label(self.scrollable_frame, text="MCTS Search Processes", font=self.pixel_font, bg=self.theme["background"], fg=self.theme["font_color"]).pack(pady=5)
+        self.mcts_workers = tk.Scale(self.scrollable_frame, from_=1, to=16, orient=tk.HORIZONTAL, bg="#333", fg=self.theme["font_color"], troughcolor="#555")
+        self.mcts_workers.set(self.settings["mcts_workers"])
+        self.mcts_workers.pack()
+
         # Action Buttons
         action_frame = tk.Frame(self.scrollable_frame, bg=self.theme["background"])
         action_frame.pack(pady=20)
@@ -110,23 +163,10 @@ class OptionsWindow:
         styled_button(self.scrollable_frame, "Back to Main Menu", self.go_back).pack(pady=10)
 
     def load_settings(self):
-        try:
-            with open(SETTINGS_FILE, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return {
-                "theme": "pixel_night",
-                "skip_turn_on_timeout": True,
-                "sound_effects": True,
-                "background_music": True,
-                "volume": 70,
-                "dark_mode": False,
-                "board_animation": True,
-                "language": "English",
-                "leaderboard_enabled": True,
-                "window_width": 600,
-                "window_height": 600
-            }
+        return settings_store.get()
+
+    def update_increment_state(self):
+        self.time_increment.configure(state=tk.NORMAL if self.clock_mode.get() == "fischer" else tk.DISABLED)
 
     def save_settings(self):
         data = {
@@ -140,11 +180,21 @@ class OptionsWindow:
             "language": self.language.get(),
             "leaderboard_enabled": self.leaderboard.get(),
             "window_width": self.window_width.get(),
-            "window_height": self.window_height.get()
+            "window_height": self.window_height.get(),
+            "turn_time": float(self.turn_time.get()),
+            "time_increment": float(self.time_increment.get()),
+            "clock_mode": self.clock_mode.get(),
+            "mcts_iterations": self.mcts_iterations.get(),
+            "mcts_workers": self.mcts_workers.get(),
+            "board_size": self.board_size.get(),
+            "win_length": min(self.win_length.get(), self.board_size.get())
         }
-        with open(SETTINGS_FILE, "w") as file:
-            json.dump(data, file, indent=4)
+        theme_changed = data["theme"] != self.settings["theme"]
+        settings_store.save(data)
         messagebox.showinfo("Saved", "✅ Settings saved successfully!")
+        if theme_changed and self.app:
+            # This screen was drawn with the old palette
+            self.app.reload("options")
 
     def backup_settings(self):
         backup_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
@@ -156,22 +206,30 @@ class OptionsWindow:
         restore_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if restore_path:
             shutil.copy(restore_path, SETTINGS_FILE)
+            settings_store.reload_if_changed()
             messagebox.showinfo("Restored", "🟢 Settings restored successfully!")
-            self.root.destroy()
-            subprocess.Popen([sys.executable, __file__])
+            self.reopen()
 
     def clear_all(self):
-        if os.path.exists(SAVE_FILE):
-            os.remove(SAVE_FILE)
-        if os.path.exists(SETTINGS_FILE):
-            os.remove(SETTINGS_FILE)
+        clear_save()
+        settings_store.reset()
         messagebox.showinfo("Cleared", "🧹 Saved game and settings have been cleared!")
-        self.root.destroy()
-        subprocess.Popen([sys.executable, __file__])
+        self.reopen()
+
+    def reopen(self):
+        # Rebuild the screen so it shows the settings now on disk
+        if self.app:
+            self.app.reload("options")
+        else:
+            self.root.destroy()
+            subprocess.Popen([sys.executable, __file__])
 
     def go_back(self):
-        self.root.destroy()
-        return_to_index()
+        if self.app:
+            self.app.show("menu")
+        else:
+            self.root.destroy()
+            return_to_index()
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,194 @@
+# Append-only binary log of played games, about one byte per move.
+#
+# File:  MAGIC, then games back to back.
+# Game:  GAME_START, header, one byte per move (square index, or SKIP for a timed-out
+#        turn), then GAME_END with the end time and result. A game cut short by a
+#        crash has no GAME_END and is read back with result None. A game left with a
+#        save to resume ends as 'suspended'; resuming logs it again from the first move,
+#        so readers should skip suspended records to avoid counting a game twice.
+# Header: start time (float64), board size, win length, flags, starting player,
+#        then mode, difficulty, player 1 and player 2 as length-prefixed UTF-8.
+#
+# Square indexes stay below 0xFC (15x15 is the largest board), so the marker bytes
+# can never be mistaken for a move.
+import argparse
+import os
+import struct
+import time
+from engine import GameEngine
+
+RECORDS_FILE = "tictactoe_games.rec"
+MAGIC = b"TTTREC1\n"
+GAME_START = 0xFC
+GAME_END = 0xFE
+SKIP = 0xFF
+
+HEADER = struct.Struct("<dBBBB")  # started_at, board_size, win_length, flags, starting player
+FOOTER = struct.Struct("<dB")     # ended_at, result
+FLAG_SKIP_ON_TIMEOUT = 0x01
+PLAYERS = ["X", "O"]
+RESULTS = ["X", "O", "draw", "abandoned", "suspended"]
+
+def pack_text(text):
+    data = text.encode("utf-8")[:255]
+    return bytes([len(data)]) + data
+
+def read_text(file):
+    length = file.read(1)
+    if not length:
+        raise EOFError
+    data = file.read(length[0])
+    if len(data) < length[0]:
+        raise EOFError
+    return data.decode("utf-8", errors="replace")
+
+class GameRecord:
+    __slots__ = ("started_at", "ended_at", "board_size", "win_length", "skip_turn_on_timeout",
+                 "starting_player", "mode", "difficulty", "player1_name", "player2_name", "moves", "result")
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def __repr__(self):
+        return (f"GameRecord({self.player1_name!r} vs {self.player2_name!r}, {self.mode}/{self.difficulty}, "
+                f"{self.board_size}x{self.board_size}, {len(self.moves)} moves, result={self.result!r})")
+
+class GameRecorder:
+    def __init__(self, path=RECORDS_FILE):
+        self.path = path
+        self.file = None
+        self.in_game = False
+
+    def open(self):
+        if self.file is None:
+            self.file = open(self.path, "ab")
+            if self.file.tell() == 0:
+                self.file.write(MAGIC)
+        return self.file
+
+    def begin_game(self, engine, mode, difficulty, player1_name, player2_name):
+        if self.in_game:
+            self.end_game("abandoned")
+        file = self.open()
+        flags = FLAG_SKIP_ON_TIMEOUT if engine.skip_turn_on_timeout else 0
+        file.write(bytes([GAME_START]))
+        file.write(HEADER.pack(time.time(), engine.board_size, engine.win_length, flags,
+                               PLAYERS.index(engine.starting_player)))
+        for text in (mode, difficulty or "", player1_name, player2_name):
+            file.write(pack_text(text))
+        self.in_game = True
+
+    def record_move(self, index):
+        if self.in_game:
+            self.file.write(bytes([index]))
+
+    def record_skip(self):
+        if self.in_game:
+            self.file.write(bytes([SKIP]))
+
+    def end_game(self, result):
+        # result is 'X', 'O', 'draw', 'abandoned' or 'suspended'
+        if not self.in_game:
+            return
+        self.file.write(bytes([GAME_END]))
+        self.file.write(FOOTER.pack(time.time(), RESULTS.index(result)))
+        self.file.flush()
+        self.in_game = False
+
+    def close(self):
+        if self.in_game:
+            self.end_game("abandoned")
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+def iter_games(path=RECORDS_FILE):
+    # Streams one GameRecord at a time, so archives of any size use constant memory
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a game record file")
+        marker = file.read(1)
+        while marker:
+            if marker[0] != GAME_START:
+                raise ValueError(f"corrupt record at byte {file.tell() - 1}")
+            try:
+                header = file.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    return
+                started_at, board_size, win_length, flags, starter = HEADER.unpack(header)
+                mode, difficulty, player1_name, player2_name = (read_text(file) for _ in range(4))
+            except EOFError:
+                return
+            record = GameRecord(started_at=started_at, board_size=board_size, win_length=win_length,
+                                skip_turn_on_timeout=bool(flags & FLAG_SKIP_ON_TIMEOUT),
+                                starting_player=PLAYERS[starter], mode=mode, difficulty=difficulty or None,
+                                player1_name=player1_name, player2_name=player2_name, moves=[])
+            moves = record.moves
+            while True:
+                marker = file.read(1)
+                if not marker or marker[0] == GAME_START:
+                    break  # unfinished game
+                byte = marker[0]
+                if byte == GAME_END:
+                    footer = file.read(FOOTER.size)
+                    if len(footer) == FOOTER.size:
+                        record.ended_at, result = FOOTER.unpack(footer)
+                        record.result = RESULTS[result]
+                    marker = file.read(1)
+                    break
+                moves.append(None if byte == SKIP else byte)
+            yield record
+
+def replay(record):
+    # Re-runs a recorded game through the rules engine and returns the finished engine
+    engine = GameEngine(record.board_size, record.win_length, record.skip_turn_on_timeout,
+                        starting_player=record.starting_player)
+    for move in record.moves:
+        if move is None:
+            engine.timeout()
+        else:
+            engine.play(move)
+    return engine
+
+def format_board(engine):
+    size = engine.board_size
+    cells = [cell or "." for cell in engine.board.to_list()]
+    return "\n".join(" ".join(cells[row * size:(row + 1) * size]) for row in range(size))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize or replay recorded tic-tac-toe games.")
+    parser.add_argument("path", nargs="?", default=RECORDS_FILE)
+    parser.add_argument("--replay", type=int, metavar="N", help="replay game number N (from 0)")
+    args = parser.parse_args(argv)
+
+    if args.replay is not None:
+        count = 0
+        for record in iter_games(args.path):
+            if count == args.replay:
+                engine = replay(record)
+                print(record)
+                print(format_board(engine))
+                print(f"Replayed result: {engine.result or 'unfinished'}")
+                return
+            count += 1
+        raise SystemExit(f"only {count} games recorded")
+
+    counts = {}
+    games = moves = suspended = 0
+    for record in iter_games(args.path):
+        if record.result == "suspended":
+            # Logged again in full when resumed
+            suspended += 1
+            continue
+        games += 1
+        moves += len(record.moves)
+        counts[record.result] = counts.get(record.result, 0) + 1
+    print(f"{games} games, {moves} moves, {os.path.getsize(args.path)} bytes")
+    for result, count in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"  {result or 'unfinished'}: {count}")
+    if suspended:
+        print(f"  ({suspended} suspended partial records skipped)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Draws the board on a single tk.Canvas: one rectangle and one text item per cell plus the
+# win line, recoloured in place. Changes are batched and flushed at a fixed frame rate.
+import time
+import tkinter as tk
+import tracing
+
+FPS = 30
+FRAME_INTERVAL = 1000 // FPS  # ms
+CELL_PADDING = 5
+DEFAULT_CELL_SIZE = 60
+
+COLORS = {
+    "background": "#1e1e1e",
+    "cell": "#1e1e1e",
+    "outline": "#00f0ff",
+    "mark": "#00f0ff",
+    "flash": "white",
+    "win": "yellow",
+    "win_line": "#ff00ff"
+}
+
+class CanvasBoard:
+    def __init__(self, master, board_size, on_click, font, colors=None):
+        self.board_size = board_size
+        self.on_click = on_click
+        self.font = font
+        self.colors = dict(COLORS, **(colors or {}))
+        self.cell_size = DEFAULT_CELL_SIZE
+        cells = board_size * board_size
+        self.marks = [""] * cells
+        self.fills = [self.colors["cell"]] * cells
+        self.dirty = set()
+        self.win_line = None
+        self.win_line_dirty = False
+        self.animations = []
+        self.frame_id = None
+        self.frame_count = 0
+        self.render_callbacks = []
+
+        side = self.cell_size * board_size
+        self.canvas = tk.Canvas(master, width=side, height=side, bg=self.colors["background"], highlightthickness=0)
+        self.cell_items = []
+        self.mark_items = []
+        for i in range(cells):
+            self.cell_items.append(self.canvas.create_rectangle(
+                *self.cell_bounds(i), fill=self.fills[i], outline=self.colors["outline"], width=2))
+            self.mark_items.append(self.canvas.create_text(
+                *self.cell_center(i), text="", font=self.font, fill=self.colors["mark"]))
+        self.win_line_item = self.canvas.create_line(0, 0, 0, 0, fill=self.colors["win_line"], width=6,
+                                                     capstyle=tk.ROUND, state=tk.HIDDEN)
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+
+    def cell_bounds(self, index):
+        row, col = divmod(index, self.board_size)
+        x = col * self.cell_size
+        y = row * self.cell_size
+        return (x + CELL_PADDING, y + CELL_PADDING,
+                x + self.cell_size - CELL_PADDING, y + self.cell_size - CELL_PADDING)
+
+    def cell_center(self, index):
+        row, col = divmod(index, self.board_size)
+        return ((col + 0.5) * self.cell_size, (row + 0.5) * self.cell_size)
+
+    def on_canvas_click(self, event):
+        col = event.x // self.cell_size
+        row = event.y // self.cell_size
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
+            self.on_click(row * self.board_size + col)
+
+    def set_mark(self, index, mark):
+        if self.marks[index] != mark:
+            self.marks[index] = mark
+            self.dirty.add(index)
+            self.schedule_frame()
+
+    def set_fill(self, index, color):
+        if self.fills[index] != color:
+            self.fills[index] = color
+            self.dirty.add(index)
+            self.schedule_frame()
+
+    def show_win_line(self, line):
+        self.win_line = line
+        self.win_line_dirty = True
+        self.schedule_frame()
+
+    def clear(self):
+        self.animations = []
+        for i in range(len(self.marks)):
+            self.set_mark(i, "")
+            self.set_fill(i, self.colors["cell"])
+        if self.win_line is not None:
+            self.show_win_line(None)
+
+    def set_colors(self, **colors):
+        self.colors.update(colors)
+        self.canvas.configure(bg=self.colors["background"])
+        for i in range(len(self.marks)):
+            self.canvas.itemconfigure(self.cell_items[i], outline=self.colors["outline"])
+            self.canvas.itemconfigure(self.mark_items[i], fill=self.colors["mark"])
+            self.set_fill(i, self.colors["cell"])
+
+    def resize(self, cell_size):
+        # Geometry changes touch every item, so this one redraws everything at once
+        self.cell_size = cell_size
+        side = cell_size * self.board_size
+        self.canvas.configure(width=side, height=side)
+        for i in range(len(self.marks)):
+            self.canvas.coords(self.cell_items[i], *self.cell_bounds(i))
+            self.canvas.coords(self.mark_items[i], *self.cell_center(i))
+        if self.win_line is not None:
+            self.win_line_dirty = True
+            self.schedule_frame()
+
+    def animate(self, duration, step, done=None):
+        # step(progress) runs once per frame with progress from 0 to 1, then done() once
+        self.animations.append((time.monotonic(), duration, step, done))
+        self.schedule_frame()
+
+    def flash_cell(self, index, duration=0.1):
+        def step(progress):
+            self.set_fill(index, self.colors["flash"] if progress < 1 else self.colors["cell"])
+        self.animate(duration, step)
+
+    def animate_win(self, line, done=None, flashes=6, interval=0.3):
+        def step(progress):
+            count = min(int(progress * flashes), flashes - 1)
+            color = self.colors["win"] if count % 2 == 0 else self.colors["flash"]
+            for i in line:
+                self.set_fill(i, color)
+        self.show_win_line(line)
+        self.animate(flashes * interval, step, done)
+
+    def after_render(self, callback):
+        # Run callback once the next frame has been flushed to the canvas
+        self.render_callbacks.append(callback)
+        self.schedule_frame()
+
+    def schedule_frame(self):
+        if self.frame_id is None:
+            self.frame_id = self.canvas.after(FRAME_INTERVAL, self.render_frame)
+
+    @tracing.span("renderer.render_frame")
+    def render_frame(self):
+        self.frame_id = None
+        self.frame_count += 1
+        finished = []
+        if self.animations:
+            now = time.monotonic()
+            running = []
+            for animation in self.animations:
+                start, duration, step, done = animation
+                progress = min((now - start) / duration, 1.0) if duration > 0 else 1.0
+                step(progress)
+                if progress < 1.0:
+                    running.append(animation)
+                elif done:
+                    finished.append(done)
+            self.animations = running
+
+        for i in self.dirty:
+            self.canvas.itemconfigure(self.cell_items[i], fill=self.fills[i])
+            self.canvas.itemconfigure(self.mark_items[i], text=self.marks[i])
+        self.dirty.clear()
+        if self.win_line_dirty:
+            self.win_line_dirty = False
+            if self.win_line is None:
+                self.canvas.itemconfigure(self.win_line_item, state=tk.HIDDEN)
+            else:
+                x1, y1 = self.cell_center(self.win_line[0])
+                x2, y2 = self.cell_center(self.win_line[-1])
+                self.canvas.coords(self.win_line_item, x1, y1, x2, y2)
+                self.canvas.itemconfigure(self.win_line_item, state=tk.NORMAL)
+                self.canvas.tag_raise(self.win_line_item)
+
+        if self.animations:
+            self.schedule_frame()
+        for done in finished:
+            done()
+        if self.render_callbacks:
+            callbacks, self.render_callbacks = self.render_callbacks, []
+            for callback in callbacks:
+                callback()
+
+    def cancel(self):
+        self.animations = []
+        self.render_callbacks = []
+        if self.frame_id is not None:
+            self.canvas.after_cancel(self.frame_id)
+            self.frame_id = None
@@ -0,0 +1,79 @@
+# Shared Tk fonts and theme palettes, created once and reused by every widget.
+import os
+import sys
+import tkinter as tk
+import tkinter.font as tkFont
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+PIXEL_FONT_FILE = os.path.join(ASSETS_DIR, "press_start_2p.ttf")
+PIXEL_FONT_FAMILY = "Press Start 2P"
+
+# Available themes
+THEMES = {
+    "pixel_night": {
+        "background": "#1e1e1e",
+        "button_bg": "#00f0ff",
+        "button_fg": "#1e1e1e",
+        "font_family": "Press Start 2P",
+        "font_color": "#00f0ff"
+    },
+    "retro_arcade": {
+        "background": "#000000",
+        "button_bg": "#ff00ff",
+        "button_fg": "#ffffff",
+        "font_family": "Press Start 2P",
+        "font_color": "#ff00ff"
+    },
+    "classic_light": {
+        "background": "#ffffff",
+        "button_bg": "#cccccc",
+        "button_fg": "#000000",
+        "font_family": "Arial",
+        "font_color": "#333333"
+    }
+}
+
+_fonts = {}
+_font_registered = False
+
+def register_bundled_font():
+    # Make the bundled pixel font available to Tk; only Windows has a per-process API for it,
+    # elsewhere the font must be installed and Tk falls back to its default otherwise
+    global _font_registered
+    if _font_registered:
+        return
+    _font_registered = True
+    if sys.platform == "win32" and os.path.exists(PIXEL_FONT_FILE):
+        try:
+            import ctypes
+            FR_PRIVATE = 0x10
+            ctypes.windll.gdi32.AddFontResourceExW(PIXEL_FONT_FILE, FR_PRIVATE, 0)
+        except (OSError, AttributeError):
+            pass
+
+def _cached(key, family, size):
+    font = _fonts.get(key)
+    if font is not None:
+        try:
+            font.cget("size")
+            return font
+        except tk.TclError:
+            pass  # made for a Tk root that has since been destroyed
+    register_bundled_font()
+    try:
+        font = tkFont.Font(family=family, size=size)
+    except tk.TclError:
+        font = tkFont.Font(size=size)
+    _fonts[key] = font
+    return font
+
+def get_font(family=PIXEL_FONT_FAMILY, size=10):
+    # Shared by many widgets: never configure a font returned from here
+    return _cached((family, size), family, size)
+
+def get_named_font(name, family=PIXEL_FONT_FAMILY, size=10):
+    # One font per name that its owner may resize in place; every widget using it follows
+    return _cached(("named", name), family, size)
+
+def get_palette(theme_name):
+    return THEMES.get(theme_name, THEMES["pixel_night"])
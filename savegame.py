@@ -0,0 +1,97 @@
+# Crash-safe save of the game in progress, written off the Tk thread.
+import json
+import os
+import threading
+import time
+
+SAVE_FILE = "tictactoe_save.json"
+SAVE_VERSION = 1
+_DELETE = object()
+
+def write_atomic(path, data):
+    # Write a temp file, fsync it and rename it over the target, so readers only
+    # ever see the old save or the complete new one
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+def load_save(path=SAVE_FILE):
+    try:
+        with open(path, "r") as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != SAVE_VERSION:
+        return None
+    return state
+
+def has_save(path=SAVE_FILE):
+    return load_save(path) is not None
+
+def clear_save(path=SAVE_FILE):
+    for name in (path, path + ".tmp"):
+        if os.path.exists(name):
+            os.remove(name)
+
+class GameSaver:
+    # Only the newest state matters, so save() just replaces a pending snapshot and
+    # returns; a background thread does the slow disk work
+    def __init__(self, path=SAVE_FILE):
+        self.path = path
+        self.pending = None
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.closed = False
+        self.last_error = None
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="game-saver", daemon=True)
+            self.thread.start()
+
+    def save(self, state):
+        state = dict(state, version=SAVE_VERSION, saved_at=time.time())
+        self.submit(state)
+
+    def clear(self):
+        self.submit(_DELETE)
+
+    def submit(self, item):
+        if self.closed:
+            return
+        with self.lock:
+            self.pending = item
+        self.start()
+        self.wakeup.set()
+
+    def run(self):
+        while True:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            with self.lock:
+                item, self.pending = self.pending, None
+            if item is not None:
+                try:
+                    if item is _DELETE:
+                        clear_save(self.path)
+                    else:
+                        write_atomic(self.path, item)
+                except OSError as error:
+                    self.last_error = error
+            if self.closed:
+                with self.lock:
+                    if self.pending is None:
+                        return
+
+    def close(self):
+        # Flushes whatever is still pending before returning
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread is not None:
+            self.wakeup.set()
+            self.thread.join()
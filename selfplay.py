@@ -0,0 +1,59 @@
+# Headless AI-vs-AI games for checking AI strength: python selfplay.py --x hard --o easy --games 100000
+import argparse
+import random
+import time
+from ai import TicTacToeAI
+from engine import GameEngine
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+# MCTS spends its whole budget on every move, so batch runs only include it when asked
+ALL_DIFFICULTIES = DIFFICULTIES + ["mcts"]
+
+def play_game(engine, players, starting_player=None):
+    engine.reset(starting_player)
+    while not engine.over:
+        move = players[engine.current_player].get_move(engine.board)
+        if move is None:
+            engine.timeout()
+        else:
+            engine.play(move)
+    return engine.result
+
+def run_match(x_difficulty, o_difficulty, games, board_size=3, win_length=3, starting_player=None, seed=None, time_budget=None,
+              iterations=None):
+    rng = random.Random(seed)
+    engine = GameEngine(board_size, win_length, rng=rng)
+    players = {
+        "X": TicTacToeAI(ai_player="X", difficulty=x_difficulty, time_budget=time_budget, rng=rng, iterations=iterations),
+        "O": TicTacToeAI(ai_player="O", difficulty=o_difficulty, time_budget=time_budget, rng=rng, iterations=iterations),
+    }
+    results = {"X": 0, "O": 0, "draw": 0}
+    for _ in range(games):
+        results[play_game(engine, players, starting_player)] += 1
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless AI-vs-AI tic-tac-toe games.")
+    parser.add_argument("--x", choices=ALL_DIFFICULTIES, default="hard", help="difficulty playing X")
+    parser.add_argument("--o", choices=ALL_DIFFICULTIES, default="easy", help="difficulty playing O")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--size", type=int, default=3, help="board size N")
+    parser.add_argument("--k", type=int, default=3, help="marks in a row to win")
+    parser.add_argument("--start", choices=["X", "O", "random"], default="random", help="who moves first")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--time-budget", type=float, default=None, help="seconds per hard move on large boards, or per MCTS move")
+    parser.add_argument("--iterations", type=int, default=None, help="MCTS playouts per move")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_match(args.x, args.o, args.games, args.size, args.k,
+                        None if args.start == "random" else args.start, args.seed, args.time_budget, args.iterations)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.x} (X) vs {args.o} (O), {args.games} games on {args.size}x{args.size}, {args.k} in a row")
+    for label, key in [("X wins", "X"), ("O wins", "O"), ("Draws", "draw")]:
+        print(f"  {label:<7} {results[key]:>10}  {100 * results[key] / args.games:6.2f}%")
+    print(f"  {args.games / elapsed:,.0f} games/s ({elapsed:.2f} s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# One cached copy of settings.json shared by every screen.
+import json
+import os
+
+SETTINGS_FILE = "settings.json"
+WATCH_INTERVAL = 1000  # ms between checks for edits made outside the app
+
+THEMES = ["pixel_night", "retro_arcade", "classic_light"]
+LANGUAGES = ["English", "French"]
+
+DEFAULTS = {
+    "theme": "pixel_night",
+    "skip_turn_on_timeout": True,
+    "sound_effects": True,
+    "background_music": True,
+    "volume": 70,
+    "dark_mode": False,
+    "board_animation": True,
+    "notifications": True,
+    "language": "English",
+    "leaderboard_enabled": True,
+    "window_width": 600,
+    "window_height": 600,
+    "board_size": 3,
+    "win_length": 3,
+    "turn_time": 5.0,
+    "time_increment": 0.0,
+    "clock_mode": "per_turn",
+    "ai_worker": "thread",
+    "audio_backend": "auto",
+    "mcts_workers": 1,
+    "mcts_iterations": 5000
+}
+
+# Key -> (type, allowed values or (min, max) range, or None for any value of the type)
+SCHEMA = {
+    "theme": (str, THEMES),
+    "skip_turn_on_timeout": (bool, None),
+    "sound_effects": (bool, None),
+    "background_music": (bool, None),
+    "volume": (int, (0, 100)),
+    "dark_mode": (bool, None),
+    "board_animation": (bool, None),
+    "notifications": (bool, None),
+    "language": (str, LANGUAGES),
+    "leaderboard_enabled": (bool, None),
+    "window_width": (int, (300, 2000)),
+    "window_height": (int, (300, 2000)),
+    "board_size": (int, (3, 15)),
+    "win_length": (int, (3, 15)),
+    "turn_time": (float, (1.0, 600.0)),
+    "time_increment": (float, (0.0, 60.0)),
+    "clock_mode": (str, ["per_turn", "fischer"]),
+    "ai_worker": (str, ["thread", "process"]),
+    "audio_backend": (str, ["auto", "pygame", "winsound", "null"]),
+    "mcts_workers": (int, (1, 16)),
+    "mcts_iterations": (int, (100, 1000000))
+}
+
+def validate(data):
+    # Unknown keys are dropped, bad or missing values fall back to the defaults
+    settings = dict(DEFAULTS)
+    if not isinstance(data, dict):
+        return settings
+    for key, (kind, allowed) in SCHEMA.items():
+        value = data.get(key)
+        if kind is int and isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if kind is float and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+            continue
+        if isinstance(allowed, tuple) and not allowed[0] <= value <= allowed[1]:
+            continue
+        if isinstance(allowed, list) and value not in allowed:
+            continue
+        settings[key] = value
+    settings["win_length"] = min(settings["win_length"], settings["board_size"])
+    return settings
+
+class SettingsStore:
+    def __init__(self, path=SETTINGS_FILE):
+        self.path = path
+        self.data = None
+        self.mtime = None
+        self.subscribers = []
+
+    def file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def read(self):
+        self.mtime = self.file_mtime()
+        try:
+            with open(self.path, "r") as file:
+                return validate(json.load(file))
+        except (OSError, ValueError):
+            return dict(DEFAULTS)
+
+    def get(self):
+        if self.data is None:
+            self.data = self.read()
+        return self.data
+
+    def __getitem__(self, key):
+        return self.get()[key]
+
+    def subscribe(self, callback):
+        # callback(settings, changed_keys); returns a function that unsubscribes
+        self.subscribers.append(callback)
+        return lambda: self.unsubscribe(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def update(self, data):
+        old = self.data or {}
+        self.data = data
+        changed = {key for key in data if old.get(key) != data[key]}
+        if changed:
+            for callback in list(self.subscribers):
+                callback(data, changed)
+        return changed
+
+    def reload_if_changed(self):
+        if self.data is not None and self.file_mtime() == self.mtime:
+            return set()
+        return self.update(self.read())
+
+    def save(self, data):
+        # Keys missing from `data` keep their current values
+        settings = validate({**self.get(), **data})
+        # Write beside the target and swap it in, so a crash never leaves half a file
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(settings, file, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        self.mtime = self.file_mtime()
+        self.update(settings)
+        return settings
+
+    def reset(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.mtime = None
+        self.update(dict(DEFAULTS))
+
+    def watch(self, widget, interval=WATCH_INTERVAL):
+        # Poll the file's mtime from the Tk loop so edits on disk reach open screens
+        def check():
+            self.reload_if_changed()
+            widget.after(interval, check)
+        widget.after(interval, check)
+
+store = SettingsStore()
+
+def load_settings():
+    return store.get()
@@ -1,12 +1,13 @@
 import tkinter as tk
-from game import start_game
 from theme_utils import center_window, load_pixel_font, styled_button
 
 class SetupWindow:
-    def __init__(self, root):
+    def __init__(self, root, app=None):
         self.root = root
-        self.root.title("Game Setup")
-        center_window(root, 600, 600)
+        self.app = app
+        self.window = root.winfo_toplevel()
+        self.window.title("Game Setup")
+        center_window(self.window, 600, 600)
         root.configure(bg="#1e1e1e")
         pixel_font = load_pixel_font()
 
@@ -19,7 +20,7 @@ class SetupWindow:
         tk.Radiobutton(root, text="Player vs Player", variable=self.mode, value="two", font=pixel_font, bg="#1e1e1e", fg="#00f0ff", selectcolor="#333").pack(anchor=tk.W)
 
         tk.Label(root, text="Choose AI Difficulty", font=pixel_font, bg="#1e1e1e", fg="#00f0ff").pack(pady=10)
-        for text, value in [("Easy", "easy"), ("Medium", "medium"), ("Hard", "hard")]:
+        for text, value in [("Easy", "easy"), ("Medium", "medium"), ("Hard", "hard"), ("MCTS", "mcts")]:
             tk.Radiobutton(root, text=text, variable=self.difficulty, value=value, font=pixel_font, bg="#1e1e1e", fg="#00f0ff", selectcolor="#333").pack(anchor=tk.W)
 
         tk.Label(root, text="Player X Name:", font=pixel_font, bg="#1e1e1e", fg="#00f0ff").pack(pady=5)
@@ -43,8 +44,12 @@ class SetupWindow:
         player2_name = self.player2_entry.get() or ("AI" if mode == "single" else "Player O")
         symbol = self.player_symbol.get()
 
-        self.root.destroy()
-        start_game(mode, difficulty, player1_name, player2_name, symbol)
+        if self.app:
+            self.app.start_game(mode, difficulty, player1_name, player2_name, symbol)
+        else:
+            from game import start_game
+            self.root.destroy()
+            start_game(mode, difficulty, player1_name, player2_name, symbol)
 
 if __name__ == "__main__":
     root = tk.Tk()
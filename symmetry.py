@@ -0,0 +1,83 @@
+# The 8 rotations and reflections of the 3x3 board, applied to bit masks.
+from collections import OrderedDict
+from board import FULL_MASK
+
+def _rotate(index):
+    row, col = divmod(index, 3)
+    return col * 3 + (2 - row)
+
+def _mirror(index):
+    row, col = divmod(index, 3)
+    return row * 3 + (2 - col)
+
+def _build_permutations():
+    perms = []
+    perm = list(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append([_mirror(i) for i in perm])
+        perm = [_rotate(i) for i in perm]
+    return perms
+
+# PERMUTATIONS[s][i] is where square i lands under symmetry s
+PERMUTATIONS = _build_permutations()
+INVERSE = [[perm.index(i) for i in range(9)] for perm in PERMUTATIONS]
+# Precomputed image of every 9-bit mask under every symmetry
+MASK_TABLES = [
+    [sum(1 << perm[i] for i in range(9) if mask >> i & 1) for mask in range(FULL_MASK + 1)]
+    for perm in PERMUTATIONS
+]
+
+def canonicalize(own, opp):
+    # Returns the smallest (own, opp) image and the symmetry that produced it
+    best = None
+    best_sym = 0
+    for sym, table in enumerate(MASK_TABLES):
+        image = (table[own], table[opp])
+        if best is None or image < best:
+            best = image
+            best_sym = sym
+    return best, best_sym
+
+def canonical_key(own, opp):
+    return min((table[own], table[opp]) for table in MASK_TABLES)
+
+def to_canonical(move, sym):
+    return PERMUTATIONS[sym][move]
+
+def from_canonical(move, sym):
+    return None if move is None else INVERSE[sym][move]
+
+class LRUCache:
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
@@ -1,51 +1,13 @@
 import tkinter as tk
-import tkinter.font as tkFont
-import json
-
-SETTINGS_FILE = "settings.json"
-
-# Available themes
-THEMES = {
-    "pixel_night": {
-        "background": "#1e1e1e",
-        "button_bg": "#00f0ff",
-        "button_fg": "#1e1e1e",
-        "font_family": "Press Start 2P",
-        "font_color": "#00f0ff"
-    },
-    "retro_arcade": {
-        "background": "#000000",
-        "button_bg": "#ff00ff",
-        "button_fg": "#ffffff",
-        "font_family": "Press Start 2P",
-        "font_color": "#ff00ff"
-    },
-    "classic_light": {
-        "background": "#ffffff",
-        "button_bg": "#cccccc",
-        "button_fg": "#000000",
-        "font_family": "Arial",
-        "font_color": "#333333"
-    }
-}
-
-def load_settings():
-    try:
-        with open(SETTINGS_FILE, "r") as file:
-            return json.load(file)
-    except FileNotFoundError:
-        return {"theme": "pixel_night"}
+from settings import store as settings_store
+from resources import THEMES, PIXEL_FONT_FAMILY, get_font, get_palette
 
 def get_current_theme():
-    settings = load_settings()
-    theme_name = settings.get("theme", "pixel_night")
-    return THEMES.get(theme_name, THEMES["pixel_night"])
+    settings = settings_store.get()
+    return get_palette(settings.get("theme", "pixel_night"))
 
 def load_pixel_font(size=10):
-    try:
-        return tkFont.Font(family="Press Start 2P", size=size)
-    except:
-        return tkFont.Font(size=size)
+    return get_font(PIXEL_FONT_FAMILY, size)
 
 def center_window(root, width, height):
     screen_width = root.winfo_screenwidth()
@@ -57,11 +19,16 @@ def center_window(root, width, height):
 def animate_button_click(button):
     original_bg = button.cget("bg")
     button.configure(bg="white")
-    button.after(100, lambda: button.configure(bg=original_bg))
+    # Scheduled on the toplevel: the button's own after callbacks die with it when a
+    # click destroys its screen, and Tk would report an invalid command
+    def restore():
+        if button.winfo_exists():
+            button.configure(bg=original_bg)
+    button.winfo_toplevel().after(100, restore)
 
 def styled_button(root, text, command):
     theme = get_current_theme()
-    font = load_pixel_font() if theme["font_family"] == "Press Start 2P" else tkFont.Font(family=theme["font_family"], size=10)
+    font = get_font(theme["font_family"], 10)
     button = tk.Button(
         root,
         text=text,
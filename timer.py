@@ -0,0 +1,63 @@
+# Turn clock driven by monotonic deadlines instead of counting Tk callbacks.
+import time
+
+PER_TURN = "per_turn"  # every turn starts from the full budget
+FISCHER = "fischer"    # each player keeps a bank that carries over, plus an increment per move
+CLOCK_MODES = [PER_TURN, FISCHER]
+# A Fischer player whose flag has fallen still gets this long per turn, so they keep playing
+# on the increment instead of being timed out the moment their turn starts
+MIN_TURN_TIME = 1.0
+
+class TurnClock:
+    def __init__(self, budget=5.0, increment=0.0, mode=PER_TURN, clock=time.monotonic, minimum=MIN_TURN_TIME):
+        if mode not in CLOCK_MODES:
+            raise ValueError(f"unknown clock mode {mode!r}")
+        self.budget = budget
+        self.increment = increment
+        self.mode = mode
+        self.minimum = min(minimum, budget)
+        self.clock = clock  # any zero-argument callable returning seconds
+        self.reset()
+
+    def reset(self):
+        self.banks = {"X": self.budget, "O": self.budget}
+        self.player = None
+        self.deadline = None
+        self.stopped_remaining = self.budget
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    def start(self, player, remaining=None):
+        # remaining overrides the player's usual allowance, e.g. when resuming a saved game
+        if remaining is None:
+            remaining = max(self.banks[player], self.minimum) if self.mode == FISCHER else self.budget
+        self.player = player
+        self.deadline = self.clock() + remaining
+
+    def remaining(self):
+        if self.deadline is None:
+            return self.stopped_remaining
+        return max(0.0, self.deadline - self.clock())
+
+    def stop(self):
+        # Ends the current turn and returns the time that was left on it
+        if self.deadline is None:
+            return self.stopped_remaining
+        left = self.remaining()
+        self.finish(left)
+        return left
+
+    def poll(self):
+        # True exactly once, on the first poll at or after the deadline
+        if self.deadline is None or self.clock() < self.deadline:
+            return False
+        self.finish(0.0)
+        return True
+
+    def finish(self, left):
+        if self.mode == FISCHER:
+            self.banks[self.player] = left + self.increment
+        self.stopped_remaining = left
+        self.deadline = None
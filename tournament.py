@@ -0,0 +1,88 @@
+# Round-robin between AI difficulties spread across all CPU cores: python tournament.py --games 100000
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from selfplay import ALL_DIFFICULTIES, DIFFICULTIES, run_match
+
+Z_95 = 1.96
+
+def chunk_seed(base_seed, x_difficulty, o_difficulty, chunk):
+    # Independent, reproducible stream per chunk regardless of which worker runs it
+    return random.Random(f"{base_seed}:{x_difficulty}:{o_difficulty}:{chunk}").getrandbits(64)
+
+def play_chunk(x_difficulty, o_difficulty, games, seed, board_size, win_length, time_budget):
+    results = run_match(x_difficulty, o_difficulty, games, board_size, win_length, seed=seed, time_budget=time_budget)
+    return x_difficulty, o_difficulty, results
+
+def score_interval(results):
+    # Mean score for X (win 1, draw 0.5) with a normal-approximation 95% interval
+    games = results["X"] + results["O"] + results["draw"]
+    if games == 0:
+        return 0.0, 0.0, 0.0
+    win = results["X"] / games
+    draw = results["draw"] / games
+    mean = win + draw / 2
+    variance = win + draw / 4 - mean * mean
+    margin = Z_95 * math.sqrt(max(variance, 0.0) / games)
+    return mean, max(0.0, mean - margin), min(1.0, mean + margin)
+
+def run_tournament(difficulties, games, chunk_size=2000, seed=0, workers=None, board_size=3, win_length=3, time_budget=None, on_result=None):
+    table = {(x, o): {"X": 0, "O": 0, "draw": 0} for x in difficulties for o in difficulties}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = []
+        for x, o in table:
+            for chunk, start in enumerate(range(0, games, chunk_size)):
+                size = min(chunk_size, games - start)
+                futures.append(pool.submit(play_chunk, x, o, size, chunk_seed(seed, x, o, chunk), board_size, win_length, time_budget))
+        for future in as_completed(futures):
+            x, o, results = future.result()
+            merged = table[(x, o)]
+            for key, count in results.items():
+                merged[key] += count
+            if on_result:
+                on_result(x, o, results, merged)
+    return table
+
+def format_table(difficulties, table):
+    width = 22
+    lines = ["X \\ O".ljust(10) + "".join(o.center(width) for o in difficulties)]
+    for x in difficulties:
+        cells = []
+        for o in difficulties:
+            mean, low, high = score_interval(table[(x, o)])
+            cells.append(f"{mean:.3f} [{low:.3f},{high:.3f}]".center(width))
+        lines.append(x.ljust(10) + "".join(cells))
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run every AI difficulty against every other on all CPU cores.")
+    parser.add_argument("--difficulties", nargs="+", choices=ALL_DIFFICULTIES, default=DIFFICULTIES)
+    parser.add_argument("--games", type=int, default=20000, help="games per matchup")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="games per worker task")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", type=int, default=3, help="board size N")
+    parser.add_argument("--k", type=int, default=3, help="marks in a row to win")
+    parser.add_argument("--time-budget", type=float, default=None, help="seconds per hard move on large boards, or per MCTS move")
+    args = parser.parse_args(argv)
+
+    def report(x, o, results, merged):
+        played = sum(merged.values())
+        print(f"  {x:>6} (X) vs {o:<6} (O): {played:>8} games  X {merged['X']:>7}  O {merged['O']:>7}  draw {merged['draw']:>7}", flush=True)
+
+    start = time.perf_counter()
+    table = run_tournament(args.difficulties, args.games, args.chunk_size, args.seed, args.workers,
+                           args.size, args.k, args.time_budget, on_result=report)
+    elapsed = time.perf_counter() - start
+    total = args.games * len(table)
+
+    print()
+    print("Score for X (win 1, draw 0.5) with 95% confidence interval")
+    print(format_table(args.difficulties, table))
+    print(f"{total} games in {elapsed:.2f} s ({total / elapsed:,.0f} games/s)")
+
+if __name__ == "__main__":
+    main()
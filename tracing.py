@@ -0,0 +1,110 @@
+# Optional hot-path instrumentation. Off unless TICTACTOE_TRACE is set when the game starts:
+#   TICTACTOE_TRACE=1 python index.py            -> tictactoe_trace.json on exit
+#   TICTACTOE_TRACE=slow.json python index.py    -> slow.json
+# Open the file in chrome://tracing or https://ui.perfetto.dev.
+# When off, span() hands back the undecorated function and region() a shared no-op,
+# so instrumented code runs as if this module did not exist.
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+
+TRACE_FILE = "tictactoe_trace.json"
+BUFFER_SIZE = 65536  # events kept; the oldest are dropped first
+
+_setting = os.environ.get("TICTACTOE_TRACE", "")
+ENABLED = _setting not in ("", "0")
+_path = _setting if _setting.endswith(".json") else TRACE_FILE
+
+# deque.append is atomic, so the AI thread and the Tk thread can share it without a lock
+_events = deque(maxlen=BUFFER_SIZE)
+_pid = os.getpid()
+_origin = time.perf_counter_ns()
+
+def now():
+    # Microseconds since import, the unit trace viewers expect
+    return (time.perf_counter_ns() - _origin) / 1000
+
+def complete(name, start, **args):
+    # A span from start (a now() value) until now, e.g. across Tk callbacks
+    _events.append(("X", name, start, now() - start, threading.get_ident(), args))
+
+def counter(name, value):
+    _events.append(("C", name, now(), 0, threading.get_ident(), {name: value}))
+
+def instant(name, **args):
+    _events.append(("i", name, now(), 0, threading.get_ident(), args))
+
+class Region:
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = now()
+        return self
+
+    def __exit__(self, *exc):
+        complete(self.name, self.start, **self.args)
+        return False
+
+class NullRegion:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_REGION = NullRegion()
+
+def region(name, **args):
+    return Region(name, args) if ENABLED else NULL_REGION
+
+def span(name):
+    # Decorator; decided once at import, so disabled tracing adds no call overhead at all
+    def decorate(func):
+        if not ENABLED:
+            return func
+        def traced(*args, **kwargs):
+            start = now()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                complete(name, start)
+        traced.__name__ = func.__name__
+        traced.__wrapped__ = func
+        return traced
+    return decorate
+
+def events():
+    return list(_events)
+
+def clear():
+    _events.clear()
+
+def to_chrome(recorded):
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    trace = []
+    for tid in {event[4] for event in recorded}:
+        trace.append({"ph": "M", "name": "thread_name", "pid": _pid, "tid": tid,
+                      "args": {"name": names.get(tid, str(tid))}})
+    for phase, name, ts, dur, tid, args in recorded:
+        event = {"ph": phase, "name": name, "ts": ts, "pid": _pid, "tid": tid, "args": args}
+        if phase == "X":
+            event["dur"] = dur
+        elif phase == "i":
+            event["s"] = "t"
+        trace.append(event)
+    return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+def dump(path=None):
+    path = path or _path
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(to_chrome(events()), f)
+    return path
+
+if ENABLED:
+    atexit.register(dump)